@@ -13,6 +13,24 @@ SETTINGS_FILE = Path.home() / ".docling_gui_settings.json"
 LOG_DIR = Path.home() / ".docling_gui_logs"
 LOG_FILE = LOG_DIR / "docling_gui.log"
 
+# Where converted files go until the user picks another output directory.
+DEFAULT_OUTPUT_DIR = str(Path.home() / "Documents")
+
+# Lines kept in the on-screen Log tab. Older lines are trimmed so the Text
+# widget stays small over long batches; the log file keeps everything.
+LOG_TAB_MAX_LINES = 5000
+
+# Index of inputs already converted (by content stamp and settings), so a batch
+# can skip files whose output is up to date. See conversion_cache.
+CONVERSION_INDEX_FILE = Path.home() / ".docling_gui_index.json"
+
+# Choices offered by the option dropdowns.
+PIPELINE_TYPES = ("Standard", "VLM", "ASR")
+VLM_MODELS = ("granite_docling", "smolvlm")
+OUTPUT_FORMATS = ("Markdown", "HTML", "JSON", "DocTags", "Text")
+TABLE_MODES = ("Fast", "Accurate")
+DEVICES = ("auto", "cpu", "cuda", "mps")
+
 # OCR engines offered in the UI. OcrMac relies on Apple's Vision framework
 # and is only usable on macOS, so it is hidden on other platforms.
 OCR_ENGINES = ["Auto", "RapidOCR", "EasyOCR"]
@@ -38,6 +56,28 @@ SUPPORTED_EXTENSIONS = {
     '.vtt': 'WebVTT Subtitles',
 }
 
+# Lowercased extensions as a tuple, so a file name can be checked with a
+# single ``name.lower().endswith(SUPPORTED_EXT_TUPLE)`` when scanning folders.
+# With this few extensions that C-level check is several times faster than
+# os.path.splitext plus a set lookup, so no separate set is kept.
+SUPPORTED_EXT_TUPLE = tuple(SUPPORTED_EXTENSIONS)
+
+# File-dialog pattern matching every supported extension.
+SUPPORTED_GLOB = " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)
+
+# File-type filters for the Add Files dialog, built once at import.
+FILE_DIALOG_TYPES = (
+    ("All Supported", SUPPORTED_GLOB),
+    ("PDF Files", "*.pdf"),
+    ("Word Documents", "*.docx"),
+    ("PowerPoint", "*.pptx"),
+    ("Excel", "*.xlsx"),
+    ("HTML Files", "*.html *.htm"),
+    ("Images", "*.png *.jpg *.jpeg *.tiff *.tif *.bmp"),
+    ("Audio Files", "*.wav *.mp3"),
+    ("All Files", "*.*"),
+)
+
 # OCR Languages
 OCR_LANGUAGES = [
     ('en', 'English'),
@@ -62,6 +102,9 @@ OCR_LANGUAGES = [
     ('uk', 'Ukrainian'),
 ]
 
+# Language codes offered in the OCR language dropdown.
+OCR_LANGUAGE_CODES = tuple(code for code, _ in OCR_LANGUAGES)
+
 ABOUT_TEXT = """Docling GUI - Full-Featured Document Converter
 
 A comprehensive graphical interface for IBM Docling.
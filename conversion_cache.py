@@ -0,0 +1,98 @@
+"""
+Index of already-converted inputs for Docling GUI.
+
+Maps a key built from an input's path, modification time, size and the
+output-affecting settings to the output it produced. Before converting, a
+batch can look each input up and skip it if its output still exists, so
+re-running a batch after adding a few files only converts the new ones.
+
+The index is a plain JSON object, loaded once per batch and saved after it.
+"""
+import hashlib
+import json
+import os
+
+from conversion_utils import CONVERTER_SETTINGS
+from logging_setup import logger
+
+# Settings that change an output's content or where it is written. Device
+# and threading only change how fast it is produced, so they are left out.
+OUTPUT_SETTINGS = tuple(
+    name for name in CONVERTER_SETTINGS
+    if name not in ('device', 'num_threads', 'use_flash_attention')
+) + ('output_format', 'max_pages', 'max_file_size_mb', 'split_long_pdfs',
+     'output_directory', 'create_subfolder')
+
+# Entries kept; the least recently converted are dropped beyond this.
+MAX_ENTRIES = 20000
+
+
+def normalize_path(filepath):
+    """Absolute, case-normalized form of ``filepath`` used in keys."""
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+def settings_digest(settings):
+    """Short hash of the output-affecting settings."""
+    relevant = {name: settings.get(name) for name in OUTPUT_SETTINGS}
+    encoded = json.dumps(relevant, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def key_for(filepath, digest):
+    """Index key for ``filepath`` converted with settings ``digest``, or None
+    if the file cannot be stat'ed."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return f"{normalize_path(filepath)}|{st.st_mtime_ns}|{st.st_size}|{digest}"
+
+
+def load_index(path):
+    """Load the index from ``path``; a missing or unreadable file is empty."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read conversion index %s: %s", path, e)
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def save_index(index, path):
+    """Write the index to ``path`` atomically (temp file + replace)."""
+    while len(index) > MAX_ENTRIES:
+        del index[next(iter(index))]
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not save conversion index %s: %s", path, e)
+
+
+def cached_output(index, key):
+    """The output recorded for ``key`` if it still exists on disk, else None."""
+    output_path = index.get(key)
+    if output_path and os.path.exists(output_path):
+        return output_path
+    return None
+
+
+def mark_done(index, key, output_path):
+    """Record that the input behind ``key`` was converted to ``output_path``."""
+    # Re-insert so dict order tracks recency for the MAX_ENTRIES trim.
+    index.pop(key, None)
+    index[key] = output_path
+
+
+def forget_outputs(index, output_paths):
+    """Drop every entry recorded for one of ``output_paths``, e.g. queued
+    writes that later failed."""
+    paths = set(output_paths)
+    for key in [key for key, path in index.items() if path in paths]:
+        del index[key]
@@ -1,72 +1,94 @@
 """
 Conversion utilities for Docling GUI
 """
+import contextlib
+import gc
+import importlib.util
 import json
 import os
+import queue
 import re
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from logging_setup import logger
+
+# orjson is optional: when installed it serializes the JSON export (several
+# times faster on large documents), otherwise the stdlib json module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Run Torch models in eager mode. Docling's enrichment models (e.g. the picture
 # classifier) otherwise try to torch.compile, which needs a C/C++ compiler
 # (MSVC `cl.exe` on Windows); without one the whole pipeline crashes with
 # "Pipeline StandardPdfPipeline failed". Eager mode is slightly slower but needs
-# no compiler. Must be set before docling/torch is imported.
+# no compiler. Must be set before docling/torch is imported (see _ensure_docling).
 os.environ.setdefault("TORCHDYNAMO_DISABLE", "1")
 
-# Try to import docling components
-try:
-    from pydantic import SecretStr
-    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-    from docling.datamodel.backend_options import PdfBackendOptions
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.pipeline_options import (
-        AcceleratorOptions,
-        PdfPipelineOptions,
-        TableFormerMode,
-    )
-    from docling.document_converter import (
-        DocumentConverter,
-        ImageFormatOption,
-        PdfFormatOption,
-    )
-    DOCLING_AVAILABLE = True
-except ImportError:
-    DOCLING_AVAILABLE = False
-    DocumentConverter = None
-    PdfFormatOption = None
-    ImageFormatOption = None
-    InputFormat = None
-    PdfPipelineOptions = None
-    TableFormerMode = None
-    AcceleratorOptions = None
-    PdfBackendOptions = None
-    PyPdfiumDocumentBackend = None
-    SecretStr = None
-
-# Try to import VLM pipeline
-try:
-    from docling.datamodel import vlm_model_specs
-    from docling.datamodel.pipeline_options import VlmPipelineOptions
-    from docling.pipeline.vlm_pipeline import VlmPipeline
-    VLM_AVAILABLE = True
-except ImportError:
-    VLM_AVAILABLE = False
-    VlmPipelineOptions = None
-    VlmPipeline = None
-    vlm_model_specs = None
+# Characters of converted content shown in the preview panel. Keeping the
+# preview this short bounds the Text widget's insert and layout work however
+# large the output is; PREVIEW_TRUNCATED marks a preview that was cut.
+PREVIEW_CHARS = 5000
+PREVIEW_TRUNCATED = (
+    "\n\n... (preview truncated; open the output file for the full text)")
 
-# Try to import ASR pipeline
-try:
-    from docling.datamodel import asr_model_specs
-    from docling.datamodel.pipeline_options import AsrPipelineOptions
-    from docling.document_converter import AudioFormatOption
-    from docling.pipeline.asr_pipeline import AsrPipeline
-    ASR_AVAILABLE = True
-except ImportError:
-    ASR_AVAILABLE = False
-    AsrPipelineOptions = None
-    AsrPipeline = None
-    asr_model_specs = None
-    AudioFormatOption = None
+# Write buffer for output files; large exports go out in few syscalls.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# With "split long PDFs" on, a PDF is converted as page ranges spread over the
+# worker processes. No range is shorter than this, so short documents are not
+# cut into pieces that cost more to start than to convert.
+SPLIT_MIN_PAGES = 10
+
+# Output formats whose exports of consecutive page ranges can simply be
+# joined; the others (HTML, JSON, DocTags) describe one whole document.
+SPLITTABLE_FORMATS = ("Markdown", "Text")
+
+# Placed between the exports of consecutive page ranges.
+SPLIT_JOINER = "\n\n"
+
+# Inputs warmed into the OS cache while the converter loads (see
+# prefetch_files), and how much of each is read where fadvise is missing.
+PREFETCH_FILES = 4
+PREFETCH_BYTES = 1 << 20
+
+# Markdown formatting stripped for the Text export: headers, bold, italic,
+# images, links. Applied in order (bold before italic, images before links).
+# Five C-level passes beat a single-pass scanner written in Python several
+# times over, and fusing them into one alternation changes the results on
+# nested/overlapping markup, so the chain is kept.
+_MD_STRIPPERS = (
+    (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
+    (re.compile(r'\*\*(.+?)\*\*'), r'\1'),
+    (re.compile(r'\*(.+?)\*'), r'\1'),
+    (re.compile(r'!\[.*?\]\(.*?\)'), ''),
+    (re.compile(r'\[(.+?)\]\(.*?\)'), r'\1'),
+)
+
+# Settings that change what build_converter produces. Output-only options
+# (format, directory, page/size limits, parallelism) are left out so changing
+# them reuses the already-loaded models.
+CONVERTER_SETTINGS = (
+    'pipeline_type', 'vlm_model', 'device', 'num_threads',
+    'use_flash_attention', 'enable_ocr', 'ocr_engine', 'ocr_language',
+    'force_full_page_ocr', 'ocr_confidence', 'do_table_structure',
+    'table_mode', 'do_cell_matching', 'do_formula_enrichment',
+    'do_code_enrichment', 'do_picture_classification',
+    'do_picture_description', 'generate_page_images',
+    'generate_picture_images', 'generate_table_images', 'images_scale',
+    'document_timeout',
+)
+
+# Converters kept loaded between batches (least recently used evicted first).
+# Each holds its own models, so keep this small to bound memory/VRAM.
+CONVERTER_CACHE_SIZE = 2
+
+_converter_cache = OrderedDict()
+_converter_cache_lock = threading.Lock()
 
 # Maps the GUI's VLM model names to docling model specifications.
 VLM_MODEL_SPECS = {
@@ -74,38 +96,173 @@ VLM_MODEL_SPECS = {
     "smolvlm": "SMOLDOCLING_TRANSFORMERS",
 }
 
-# Try to import OCR options
-try:
-    from docling.datamodel.pipeline_options import (
-        EasyOcrOptions,
-        RapidOcrOptions,
-    )
-    OCR_OPTIONS_AVAILABLE = True
-except ImportError:
-    OCR_OPTIONS_AVAILABLE = False
-    EasyOcrOptions = None
-    RapidOcrOptions = None
+# Whether docling is installed, checked without importing it: importing the
+# docling stack pulls in torch and takes seconds, so it is deferred until a
+# conversion actually needs it (see _ensure_docling). A broken install that
+# is found here but fails to import is downgraded to False on first use.
+DOCLING_AVAILABLE = importlib.util.find_spec("docling") is not None
 
-# Try to import OcrMac (macOS only)
-try:
-    from docling.datamodel.pipeline_options import OcrMacOptions
-    OCRMAC_AVAILABLE = True
-except ImportError:
-    OCRMAC_AVAILABLE = False
-    OcrMacOptions = None
+# Everything below is bound by _import_docling(). Reading any of these as a
+# module attribute (e.g. ``conversion_utils.VLM_AVAILABLE``) loads docling
+# on demand via the module-level __getattr__.
+_LAZY_NAMES = frozenset({
+    'DocumentConverter', 'PdfFormatOption', 'ImageFormatOption', 'InputFormat',
+    'ConversionStatus', 'PdfPipelineOptions', 'TableFormerMode',
+    'AcceleratorOptions', 'PdfBackendOptions', 'PyPdfiumDocumentBackend',
+    'SecretStr',
+    'VLM_AVAILABLE', 'VlmPipelineOptions', 'VlmPipeline', 'vlm_model_specs',
+    'ASR_AVAILABLE', 'AsrPipelineOptions', 'AsrPipeline', 'asr_model_specs',
+    'AudioFormatOption', 'OCR_OPTIONS_AVAILABLE', 'EasyOcrOptions',
+    'RapidOcrOptions', 'OCRMAC_AVAILABLE', 'OcrMacOptions',
+    'PICTURE_DESCRIPTION_AVAILABLE', 'granite_picture_description',
+    'smolvlm_picture_description',
+})
+
+_docling_lock = threading.Lock()
+_docling_loaded = False
+
+
+def _import_docling():
+    """Import the docling components and bind them as module globals."""
+    global DOCLING_AVAILABLE
+    global DocumentConverter, PdfFormatOption, ImageFormatOption, InputFormat
+    global ConversionStatus
+    global PdfPipelineOptions, TableFormerMode, AcceleratorOptions
+    global PdfBackendOptions, PyPdfiumDocumentBackend, SecretStr
+    global VLM_AVAILABLE, VlmPipelineOptions, VlmPipeline, vlm_model_specs
+    global ASR_AVAILABLE, AsrPipelineOptions, AsrPipeline, asr_model_specs
+    global AudioFormatOption, OCR_OPTIONS_AVAILABLE, EasyOcrOptions
+    global RapidOcrOptions, OCRMAC_AVAILABLE, OcrMacOptions
+    global PICTURE_DESCRIPTION_AVAILABLE, granite_picture_description
+    global smolvlm_picture_description
+
+    # Try to import docling components
+    try:
+        from pydantic import SecretStr
+        from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+        from docling.datamodel.backend_options import PdfBackendOptions
+        from docling.datamodel.base_models import ConversionStatus, InputFormat
+        from docling.datamodel.pipeline_options import (
+            AcceleratorOptions,
+            PdfPipelineOptions,
+            TableFormerMode,
+        )
+        from docling.document_converter import (
+            DocumentConverter,
+            ImageFormatOption,
+            PdfFormatOption,
+        )
+        DOCLING_AVAILABLE = True
+    except ImportError:
+        DOCLING_AVAILABLE = False
+        DocumentConverter = None
+        PdfFormatOption = None
+        ImageFormatOption = None
+        InputFormat = None
+        ConversionStatus = None
+        PdfPipelineOptions = None
+        TableFormerMode = None
+        AcceleratorOptions = None
+        PdfBackendOptions = None
+        PyPdfiumDocumentBackend = None
+        SecretStr = None
+
+    # Try to import VLM pipeline
+    try:
+        from docling.datamodel import vlm_model_specs
+        from docling.datamodel.pipeline_options import VlmPipelineOptions
+        from docling.pipeline.vlm_pipeline import VlmPipeline
+        VLM_AVAILABLE = True
+    except ImportError:
+        VLM_AVAILABLE = False
+        VlmPipelineOptions = None
+        VlmPipeline = None
+        vlm_model_specs = None
+
+    # Try to import ASR pipeline
+    try:
+        from docling.datamodel import asr_model_specs
+        from docling.datamodel.pipeline_options import AsrPipelineOptions
+        from docling.document_converter import AudioFormatOption
+        from docling.pipeline.asr_pipeline import AsrPipeline
+        ASR_AVAILABLE = True
+    except ImportError:
+        ASR_AVAILABLE = False
+        AsrPipelineOptions = None
+        AsrPipeline = None
+        asr_model_specs = None
+        AudioFormatOption = None
+
+    # Try to import OCR options
+    try:
+        from docling.datamodel.pipeline_options import (
+            EasyOcrOptions,
+            RapidOcrOptions,
+        )
+        OCR_OPTIONS_AVAILABLE = True
+    except ImportError:
+        OCR_OPTIONS_AVAILABLE = False
+        EasyOcrOptions = None
+        RapidOcrOptions = None
+
+    # Try to import OcrMac (macOS only)
+    try:
+        from docling.datamodel.pipeline_options import OcrMacOptions
+        OCRMAC_AVAILABLE = True
+    except ImportError:
+        OCRMAC_AVAILABLE = False
+        OcrMacOptions = None
+
+    # Try to import picture-description presets so the description model can
+    # follow the user's VLM model selection.
+    try:
+        from docling.datamodel.pipeline_options import (
+            granite_picture_description,
+            smolvlm_picture_description,
+        )
+        PICTURE_DESCRIPTION_AVAILABLE = True
+    except ImportError:
+        PICTURE_DESCRIPTION_AVAILABLE = False
+        granite_picture_description = None
+        smolvlm_picture_description = None
+
+    logger.debug("Docling loaded: VLM=%s  ASR=%s  OCR-options=%s",
+                 VLM_AVAILABLE, ASR_AVAILABLE, OCR_OPTIONS_AVAILABLE)
+
+
+def _limit_native_threads(num_threads, override=False):
+    """
+    Size the OpenMP/MKL thread pools to the thread setting.
+
+    Torch and the OCR runtimes read these when they are first imported and
+    otherwise start one thread per core, which then competes with docling's
+    own pool. They only take effect before that import, so later changes to
+    the setting go through docling's torch.set_num_threads instead. Values
+    the user exported are kept unless ``override`` is set.
+    """
+    for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS'):
+        if override:
+            os.environ[name] = str(num_threads)
+        else:
+            os.environ.setdefault(name, str(num_threads))
+
+
+def _ensure_docling():
+    """Import docling on first use. Thread-safe; returns DOCLING_AVAILABLE."""
+    global _docling_loaded
+    with _docling_lock:
+        if not _docling_loaded:
+            _import_docling()
+            _docling_loaded = True
+    return DOCLING_AVAILABLE
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _ensure_docling()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Try to import picture-description presets so the description model can
-# follow the user's VLM model selection.
-try:
-    from docling.datamodel.pipeline_options import (
-        granite_picture_description,
-        smolvlm_picture_description,
-    )
-    PICTURE_DESCRIPTION_AVAILABLE = True
-except ImportError:
-    PICTURE_DESCRIPTION_AVAILABLE = False
-    granite_picture_description = None
-    smolvlm_picture_description = None
 
 __all__ = [
     'DOCLING_AVAILABLE',
@@ -119,6 +276,27 @@ __all__ = [
     'build_converter',
     'pdf_needs_password',
     'pdf_password_valid',
+    'pdf_page_count',
+    'prefetch_files',
+    'page_ranges',
+    'get_converter',
+    'clear_converter_cache',
+    'converter_cache_key',
+    'build_convert_kwargs',
+    'resolve_output_path',
+    'resolve_output_paths',
+    'save_output',
+    'save_joined_output',
+    'OutputWriter',
+    'result_error',
+    'is_transient_error',
+    'parallel_worker_count',
+    'plan_page_splits',
+    'thread_document_count',
+    'document_concurrency',
+    'init_worker_process',
+    'convert_in_worker_process',
+    'convert_pages_in_worker_process',
     'DocumentConverter',
     'PdfFormatOption',
     'InputFormat',
@@ -137,6 +315,15 @@ def get_output_extension(format_name):
     return extensions.get(format_name, ".txt")
 
 
+def _dumps_document_json(data):
+    """Serialize an exported document dict to indented, non-ASCII-escaped JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def export_content(result, format_name):
     """Export converted content in the specified format"""
     doc = result.document
@@ -146,25 +333,28 @@ def export_content(result, format_name):
     elif format_name == "HTML":
         return doc.export_to_html()
     elif format_name == "JSON":
-        return json.dumps(doc.export_to_dict(), indent=2, ensure_ascii=False)
+        return _dumps_document_json(doc.export_to_dict())
     elif format_name == "DocTags":
         if hasattr(doc, 'export_to_doctags'):
             return doc.export_to_doctags()
         else:
             return doc.export_to_markdown()
     elif format_name == "Text":
-        md = doc.export_to_markdown()
-        # Strip markdown formatting: headers, bold, italic, links, images
-        text = re.sub(r'^#{1,6}\s+', '', md, flags=re.MULTILINE)
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.+?)\*', r'\1', text)
-        text = re.sub(r'!\[.*?\]\(.*?\)', '', text)
-        text = re.sub(r'\[(.+?)\]\(.*?\)', r'\1', text)
+        text = doc.export_to_markdown()
+        for pattern, replacement in _MD_STRIPPERS:
+            text = pattern.sub(replacement, text)
         return text
     else:
         return doc.export_to_markdown()
 
 
+def _declared_fields(options_cls, values):
+    """Keep only the entries of ``values`` that ``options_cls`` declares as
+    fields, for options that only some docling versions accept."""
+    fields = getattr(options_cls, 'model_fields', {})
+    return {name: value for name, value in values.items() if name in fields}
+
+
 def build_pipeline_options(settings):
     """
     Build pipeline options from settings dictionary.
@@ -174,9 +364,20 @@ def build_pipeline_options(settings):
     - ocr_engine, ocr_language, ...
     - device, num_threads, ...
     """
-    if not DOCLING_AVAILABLE:
+    if not _ensure_docling():
         return None
 
+    # Options that older docling releases lack are passed only if declared
+    # on the model, checked once against the class rather than per instance.
+    optional = {
+        'do_formula_enrichment': settings.get('do_formula_enrichment', True),
+        'do_code_enrichment': settings.get('do_code_enrichment', True),
+        'images_scale': settings.get('images_scale', 1.0),
+    }
+    timeout = settings.get('document_timeout', 0)
+    if timeout > 0:
+        optional['document_timeout'] = float(timeout)
+
     # Create pipeline options (defaults match GUI init_variables)
     pipeline_options = PdfPipelineOptions(
         do_ocr=settings.get('enable_ocr', True),
@@ -187,16 +388,9 @@ def build_pipeline_options(settings):
         generate_page_images=settings.get('generate_page_images', False),
         generate_picture_images=settings.get('generate_picture_images', False),
         generate_table_images=settings.get('generate_table_images', False),
+        **_declared_fields(PdfPipelineOptions, optional),
     )
 
-    # Set optional enrichment options if available
-    if hasattr(pipeline_options, 'do_formula_enrichment'):
-        pipeline_options.do_formula_enrichment = settings.get(
-            'do_formula_enrichment', True)
-    if hasattr(pipeline_options, 'do_code_enrichment'):
-        pipeline_options.do_code_enrichment = settings.get(
-            'do_code_enrichment', True)
-
     # When picture description is enabled, pick the description model to
     # match the selected VLM model (granite -> granite, otherwise smolvlm).
     # Without this the description model ignores the VLM model selector.
@@ -207,14 +401,13 @@ def build_pipeline_options(settings):
             pipeline_options.picture_description_options = smolvlm_picture_description
 
     # Table structure options
-    if hasattr(pipeline_options, 'table_structure_options'):
-        if settings.get('table_mode') == "Fast":
-            pipeline_options.table_structure_options.mode = TableFormerMode.FAST
-        else:
-            pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
+    if settings.get('table_mode') == "Fast":
+        pipeline_options.table_structure_options.mode = TableFormerMode.FAST
+    else:
+        pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
 
-        pipeline_options.table_structure_options.do_cell_matching = settings.get(
-            'do_cell_matching', True)
+    pipeline_options.table_structure_options.do_cell_matching = settings.get(
+        'do_cell_matching', True)
 
     # OCR options
     if OCR_OPTIONS_AVAILABLE and settings.get('enable_ocr', False):
@@ -223,11 +416,22 @@ def build_pipeline_options(settings):
         force_full_page = settings.get('force_full_page_ocr', False)
         confidence = settings.get('ocr_confidence', 0.5)
 
+        # EasyOCR is a separate install. Without it, docling fails every
+        # document at pipeline start, so use the built-in RapidOCR (also the
+        # lighter, faster engine on CPU) rather than fail the whole batch.
+        if ocr_engine == "EasyOCR" and importlib.util.find_spec("easyocr") is None:
+            logger.warning("EasyOCR is not installed; using RapidOCR instead")
+            ocr_engine = "RapidOCR"
+
         if ocr_engine == "EasyOCR":
             pipeline_options.ocr_options = EasyOcrOptions(
                 lang=[lang],
                 force_full_page_ocr=force_full_page,
-                confidence_threshold=confidence
+                confidence_threshold=confidence,
+                # int8 dynamic quantization roughly doubles CPU throughput.
+                **_declared_fields(EasyOcrOptions, {
+                    'quantize': settings.get('device') == 'cpu',
+                })
             )
         elif ocr_engine == "RapidOCR" or ocr_engine == "Auto":
             pipeline_options.ocr_options = RapidOcrOptions(
@@ -243,20 +447,11 @@ def build_pipeline_options(settings):
     # Accelerator options
     pipeline_options.accelerator_options = AcceleratorOptions(
         device=settings.get('device', 'auto'),
-        num_threads=settings.get('num_threads', 4)
+        num_threads=settings.get('num_threads', 4),
+        **_declared_fields(AcceleratorOptions, {
+            'cuda_use_flash_attention2': settings.get('use_flash_attention', False),
+        })
     )
-    if hasattr(pipeline_options.accelerator_options, 'cuda_use_flash_attention2'):
-        pipeline_options.accelerator_options.cuda_use_flash_attention2 = settings.get(
-            'use_flash_attention', False)
-
-    # Images scale
-    if hasattr(pipeline_options, 'images_scale'):
-        pipeline_options.images_scale = settings.get('images_scale', 1.0)
-
-    # Document timeout
-    timeout = settings.get('document_timeout', 0)
-    if timeout > 0 and hasattr(pipeline_options, 'document_timeout'):
-        pipeline_options.document_timeout = float(timeout)
 
     return pipeline_options
 
@@ -298,6 +493,61 @@ def pdf_password_valid(filepath, password):
         return False
 
 
+def pdf_page_count(filepath):
+    """Number of pages in a PDF, or None if pypdfium2 cannot open it."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+    try:
+        doc = pdfium.PdfDocument(filepath)
+    except Exception:  # pylint: disable=broad-except
+        return None  # encrypted, corrupt or not a PDF
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+
+def prefetch_files(paths, read_bytes=PREFETCH_BYTES):
+    """
+    Ask the OS to start reading ``paths`` into its page cache.
+
+    Meant for a background thread while the converter loads its models, so
+    the first inputs come from memory once conversion starts. Uses
+    posix_fadvise(WILLNEED) where available (the kernel reads the whole file
+    asynchronously); elsewhere the first ``read_bytes`` of each file are read.
+    Unreadable files are skipped; conversion will report them.
+    """
+    fadvise = getattr(os, 'posix_fadvise', None)
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                if fadvise is not None:
+                    fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    f.read(read_bytes)
+        except OSError:
+            continue
+
+
+def page_ranges(page_count, parts):
+    """
+    Split pages 1..``page_count`` into at most ``parts`` consecutive
+    (first, last) ranges, as even as possible and each at least
+    SPLIT_MIN_PAGES long (so a short document stays one range).
+    """
+    parts = max(1, min(parts, page_count // SPLIT_MIN_PAGES))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    first = 1
+    for index in range(parts):
+        last = first + size - 1 + (1 if index < extra else 0)
+        ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
 def _pdf_password_kwargs(password):
     """
     Extra PdfFormatOption kwargs for opening an encrypted PDF.
@@ -325,7 +575,8 @@ def build_converter(settings, password=None):
 
     Returns (converter, pipeline_name) tuple.
     """
-    if not DOCLING_AVAILABLE:
+    _limit_native_threads(settings.get('num_threads', 4))
+    if not _ensure_docling():
         return None, "unavailable"
 
     pipeline_type = settings.get('pipeline_type', 'Standard')
@@ -396,3 +647,431 @@ def build_converter(settings, password=None):
         converter = DocumentConverter()
 
     return converter, "Standard"
+
+
+def converter_cache_key(settings):
+    """Key identifying the converter ``settings`` would build."""
+    return json.dumps(
+        {name: settings.get(name) for name in CONVERTER_SETTINGS},
+        sort_keys=True)
+
+
+def get_converter(settings):
+    """
+    Return (converter, pipeline_name) for ``settings``, reusing a cached one.
+
+    Building a converter loads its models, which takes seconds, so the last
+    CONVERTER_CACHE_SIZE converters are kept and reused when a batch runs
+    with the same converter settings. Thread-safe; a build in progress on
+    another thread is waited for rather than duplicated.
+    """
+    key = converter_cache_key(settings)
+    with _converter_cache_lock:
+        cached = _converter_cache.get(key)
+        if cached is not None:
+            _converter_cache.move_to_end(key)
+            return cached
+
+        built = build_converter(settings)
+        if built[0] is not None:
+            _converter_cache[key] = built
+            while len(_converter_cache) > CONVERTER_CACHE_SIZE:
+                _converter_cache.popitem(last=False)
+        return built
+
+
+def clear_converter_cache():
+    """Drop all cached converters and free the memory their models held.
+
+    Collects garbage so the model weights are released now rather than at
+    some later collection, and, if torch is already loaded, returns its
+    cached CUDA memory to the driver so other programs can use the GPU.
+
+    Returns False, clearing nothing, if a converter is being built (see
+    get_converter): waiting for that could block the caller for the whole
+    docling import.
+    """
+    if not _converter_cache_lock.acquire(blocking=False):
+        return False
+    try:
+        _converter_cache.clear()
+    finally:
+        _converter_cache_lock.release()
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    return True
+
+
+def build_convert_kwargs(settings):
+    """
+    Extra keyword arguments for ``DocumentConverter.convert`` from settings.
+
+    Applies the page limit (first N pages) and the max file size (MB -> bytes);
+    0 means unlimited for both.
+    """
+    convert_kwargs = {}
+    max_pages = settings.get('max_pages', 0)
+    if max_pages and max_pages > 0:
+        convert_kwargs['page_range'] = (1, max_pages)
+
+    max_file_size_mb = settings.get('max_file_size_mb', 0)
+    if max_file_size_mb and max_file_size_mb > 0:
+        convert_kwargs['max_file_size'] = max_file_size_mb * 1024 * 1024
+    return convert_kwargs
+
+
+def resolve_output_path(filepath, settings, taken=()):
+    """
+    Return the output path for ``filepath``, creating its directory.
+
+    Honours the subfolder-per-file option, and appends a timestamp instead of
+    overwriting an existing output unless overwriting is enabled. Paths in
+    ``taken`` (outputs of the same batch not yet written) are never reused,
+    even when overwriting: two inputs with the same name must not share one
+    output.
+    """
+    filename = os.path.basename(filepath)
+    output_ext = get_output_extension(settings['output_format'])
+    base_name = os.path.splitext(filename)[0]
+    output_dir = settings['output_directory']
+
+    if settings['create_subfolder']:
+        output_dir = os.path.join(output_dir, base_name)
+
+    # Cheap when the directory exists (one failed mkdir), and it must stay
+    # per file: subfolders are per file, and the user may delete the output
+    # directory mid-batch.
+    os.makedirs(output_dir, exist_ok=True)
+
+    output_path = os.path.join(output_dir, f"{base_name}{output_ext}")
+
+    # Check for overwrite
+    if output_path in taken or (
+            not settings['overwrite_files'] and os.path.exists(output_path)):
+        stem = f"{base_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        output_path = os.path.join(output_dir, f"{stem}{output_ext}")
+        # Same name within the same second: number the extra outputs.
+        count = 2
+        while output_path in taken or os.path.exists(output_path):
+            output_path = os.path.join(output_dir, f"{stem}_{count}{output_ext}")
+            count += 1
+    return output_path
+
+
+def resolve_output_paths(files, settings):
+    """
+    Output path for each of ``files``, as {filepath: output_path}, with no
+    two inputs sharing one (see resolve_output_path).
+
+    For batches whose outputs are written by worker processes, which cannot
+    see each other's choices: the paths are picked here, up front.
+    """
+    taken = set()
+    paths = {}
+    for filepath in files:
+        paths[filepath] = resolve_output_path(filepath, settings, taken)
+        taken.add(paths[filepath])
+    return paths
+
+
+def _write_output(path, data):
+    """Write ``data`` to ``path`` atomically (temp file + replace).
+
+    A write interrupted by a cancel, crash or full disk leaves no truncated
+    output behind for the user (or the converted-files index) to mistake
+    for a finished one.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class OutputWriter:
+    """
+    Writes finished outputs on a background thread, so the next document
+    converts while the previous one is written.
+
+    At most ``max_pending`` outputs wait in the queue; ``submit`` blocks
+    beyond that to bound memory. Use as a context manager: leaving the block
+    waits for every queued write. Failed writes are collected in ``failed``
+    as (path, exception) pairs.
+    """
+
+    def __init__(self, max_pending=4):
+        self.paths = set()
+        self.failed = []
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(
+            target=self._run, name="output-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, path, data):
+        """Queue ``data`` (bytes) to be written to ``path``."""
+        self.paths.add(path)
+        self._queue.put((path, data))
+
+    def close(self):
+        """Wait for all queued writes to finish."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while (item := self._queue.get()) is not None:
+            path, data = item
+            try:
+                _write_output(path, data)
+            # Anything escaping here would end the thread and leave submit
+            # and close blocked on the queue forever.
+            except Exception as e:  # pylint: disable=broad-except
+                self.failed.append((path, e))
+
+
+def _preview(content):
+    """The first PREVIEW_CHARS characters of ``content``, followed by
+    PREVIEW_TRUNCATED if there was more."""
+    if len(content) <= PREVIEW_CHARS:
+        return content
+    return content[:PREVIEW_CHARS] + PREVIEW_TRUNCATED
+
+
+def save_output(result, filepath, settings, writer=None, output_path=None):
+    """
+    Export a conversion result in the selected format and write it to disk.
+
+    The content is encoded once and written in binary mode, so output is
+    UTF-8 with the exporter's own line endings on every platform. With an
+    OutputWriter the write is queued on its thread instead of done here.
+    ``output_path`` is picked with resolve_output_path unless given.
+    Returns (output_path, preview), the preview being the first PREVIEW_CHARS
+    characters (see _preview); the full export is released as soon as it is
+    written.
+    """
+    if output_path is None:
+        taken = writer.paths if writer is not None else ()
+        output_path = resolve_output_path(filepath, settings, taken)
+    content = export_content(result, settings['output_format'])
+    preview = _preview(content)
+    data = content.encode('utf-8')
+    # Only the bytes are needed from here on; drop the str copy before a
+    # submit that may block on a full write queue.
+    del content
+    if writer is not None:
+        writer.submit(output_path, data)
+    else:
+        _write_output(output_path, data)
+    return output_path, preview
+
+
+def save_joined_output(parts, filepath, settings, output_path=None):
+    """
+    Write the exports of a PDF converted in page ranges (see
+    plan_page_splits) as one output, in order. ``output_path`` and the
+    return value are as for save_output.
+    """
+    if output_path is None:
+        output_path = resolve_output_path(filepath, settings)
+    content = SPLIT_JOINER.join(parts)
+    _write_output(output_path, content.encode('utf-8'))
+    return output_path, _preview(content)
+
+
+def result_error(result):
+    """
+    Error message for a failed ``convert_all`` result, or None on success.
+
+    Partial success (some pages failed) counts as success, as it does for
+    ``DocumentConverter.convert``.
+    """
+    if result.status in (ConversionStatus.SUCCESS,
+                         ConversionStatus.PARTIAL_SUCCESS):
+        return None
+    messages = [item.error_message for item in result.errors]
+    return "; ".join(messages) or f"conversion {result.status.value}"
+
+
+# Substrings of docling error messages that mark a failure as transient.
+_TRANSIENT_MARKERS = (
+    "out of memory", "timed out", "connection reset", "connection aborted",
+    "temporarily unavailable",
+)
+
+
+def is_transient_error(error):
+    """
+    True if a conversion error (exception or message) looks transient - a
+    timeout, a dropped connection or a GPU out-of-memory - so that retrying
+    the document may succeed.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+# Whether torch sees a CUDA or MPS device; None until first checked.
+_gpu_present = None
+
+
+def _uses_gpu(settings):
+    """
+    True if conversions with ``settings`` run on a GPU: device cuda or mps,
+    or auto on a machine that has one (docling's auto picks it).
+
+    For auto this imports torch, which takes seconds, so only ask when the
+    answer matters.
+    """
+    global _gpu_present
+    device = settings.get('device')
+    if device != 'auto':
+        return device in ('cuda', 'mps')
+    if _gpu_present is None:
+        # The thread pools must be sized before torch is first imported.
+        _limit_native_threads(settings.get('num_threads', 4))
+        try:
+            import torch
+        except Exception:  # pylint: disable=broad-except
+            _gpu_present = False
+        else:
+            mps = getattr(torch.backends, 'mps', None)
+            _gpu_present = bool(torch.cuda.is_available()
+                                or (mps is not None and mps.is_available()))
+    return _gpu_present
+
+
+def parallel_worker_count(settings, file_count):
+    """
+    Number of worker processes to convert ``file_count`` files with.
+
+    GPUs, including one chosen by the auto device, are capped at one worker:
+    every process loads its own copy of the models, and several copies on one
+    GPU contend for (and exhaust) VRAM.
+    """
+    workers = max(1, min(settings.get('parallel_files', 1), file_count))
+    if workers > 1 and _uses_gpu(settings):
+        return 1
+    return workers
+
+
+def plan_page_splits(files, settings):
+    """
+    Page ranges to convert separately for each long PDF in ``files``.
+
+    Returns {filepath: [(first, last), ...]} for the PDFs worth splitting.
+    Empty unless splitting is enabled, the output format can be joined (see
+    SPLITTABLE_FORMATS), and the settings allow several worker processes.
+    Each PDF's page count is read with pypdfium2; one that cannot be opened
+    (e.g. encrypted) is converted whole.
+    """
+    if (not settings.get('split_long_pdfs')
+            or settings.get('output_format') not in SPLITTABLE_FORMATS):
+        return {}
+    parts = parallel_worker_count(settings, settings.get('parallel_files', 1))
+    if parts < 2:
+        return {}
+
+    max_pages = settings.get('max_pages', 0)
+    splits = {}
+    for filepath in files:
+        if not filepath.lower().endswith('.pdf'):
+            continue
+        page_count = pdf_page_count(filepath)
+        if not page_count:
+            continue
+        if max_pages > 0:
+            page_count = min(page_count, max_pages)
+        ranges = page_ranges(page_count, parts)
+        if len(ranges) > 1:
+            splits[filepath] = ranges
+    return splits
+
+
+def thread_document_count(settings, file_count):
+    """
+    Number of documents ``convert_all`` should process at once on threads
+    sharing one converter.
+
+    Only used on a GPU, where parallel_worker_count keeps a single process:
+    threads share the one copy of the models already in VRAM.
+    """
+    threads = max(1, min(settings.get('parallel_files', 1), file_count))
+    if threads > 1 and _uses_gpu(settings):
+        return threads
+    return 1
+
+
+@contextlib.contextmanager
+def document_concurrency(threads):
+    """
+    Let ``convert_all`` calls inside the block convert up to ``threads``
+    documents at once, using docling's own batch concurrency settings.
+
+    Those settings are process-wide, so they are restored on exit. With
+    ``threads`` of 1, docling's defaults are left alone.
+    """
+    if threads <= 1 or not _ensure_docling():
+        yield
+        return
+    from docling.datamodel.settings import settings as docling_settings
+    perf = docling_settings.perf
+    saved = perf.doc_batch_size, perf.doc_batch_concurrency
+    perf.doc_batch_size = max(perf.doc_batch_size, threads)
+    perf.doc_batch_concurrency = threads
+    try:
+        yield
+    finally:
+        perf.doc_batch_size, perf.doc_batch_concurrency = saved
+
+
+# Converter owned by a conversion worker process (see convert_in_worker_process).
+_process_converter = None
+
+
+def init_worker_process(settings):
+    """ProcessPoolExecutor initializer: build this process's converter once."""
+    global _process_converter
+    # Spawned workers inherit the parent's thread variables; replace them with
+    # this worker's share of the thread budget.
+    _limit_native_threads(settings['num_threads'], override=True)
+    _process_converter, _ = build_converter(settings)
+
+
+def convert_in_worker_process(filepath, settings, convert_kwargs, output_path):
+    """
+    Convert one file inside a worker process and save it to ``output_path``
+    (picked by the parent; see resolve_output_paths).
+
+    Module-level so it can be pickled for a ProcessPoolExecutor. Returns
+    (output_path, preview) where preview is the head of the exported content.
+    """
+    if _process_converter is None:
+        raise RuntimeError("Docling could not be imported in the worker process")
+    result = _process_converter.convert(filepath, **convert_kwargs)
+    return save_output(result, filepath, settings, output_path=output_path)
+
+
+def convert_pages_in_worker_process(filepath, settings, convert_kwargs, pages):
+    """
+    Convert the (first, last) ``pages`` of one PDF inside a worker process.
+
+    Returns the exported content rather than writing it; the caller joins
+    the ranges of a document with save_joined_output.
+    """
+    if _process_converter is None:
+        raise RuntimeError("Docling could not be imported in the worker process")
+    result = _process_converter.convert(
+        filepath, **{**convert_kwargs, 'page_range': pages})
+    return export_content(result, settings['output_format'])
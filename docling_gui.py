@@ -4,30 +4,52 @@ Supports all Docling features including OCR, VLM, ASR pipelines
 """
 
 import contextlib
+import functools
+import itertools
 import json
+import multiprocessing
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
 import webbrowser
-from datetime import datetime
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from tkinter import filedialog, messagebox, simpledialog, ttk
+from tkinter import font as tkfont
 from typing import Any
 
 # Import refactored modules
 import config
+import conversion_cache
 import gui_panels
 import logging_setup
 from conversion_utils import (
     DOCLING_AVAILABLE,
+    PREFETCH_FILES,
+    OutputWriter,
+    build_convert_kwargs,
     build_converter,
-    export_content,
-    get_output_extension,
+    clear_converter_cache,
+    convert_in_worker_process,
+    convert_pages_in_worker_process,
+    document_concurrency,
+    get_converter,
+    init_worker_process,
+    is_transient_error,
+    parallel_worker_count,
     pdf_needs_password,
     pdf_password_valid,
+    plan_page_splits,
+    prefetch_files,
+    resolve_output_paths,
+    result_error,
+    save_joined_output,
+    save_output,
+    thread_document_count,
 )
 from logging_setup import logger
 
@@ -40,10 +62,31 @@ except ImportError:
     DND_FILES = None
 
 
+# orjson is optional: when installed it encodes/decodes the settings file,
+# otherwise the stdlib json module is used. Both produce the same file.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(obj):
+    """Serialize ``obj`` to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads_json(raw):
+    """Parse JSON bytes. Raises json.JSONDecodeError (orjson's subclasses it)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # Single source of truth for every option variable: name -> default value.
 # The tk variable type is inferred from the default (bool -> BooleanVar,
-# int -> IntVar, float -> DoubleVar, str -> StringVar). A callable default is
-# evaluated at init/reset time (used for the home-relative output directory).
+# int -> IntVar, float -> DoubleVar, str -> StringVar).
 OPTION_DEFAULTS: dict[str, Any] = {
     # Basic
     "pipeline_type": "Standard",
@@ -75,21 +118,40 @@ OPTION_DEFAULTS: dict[str, Any] = {
     # Accelerator
     "device": "auto",
     "num_threads": 4,
+    "parallel_files": 1,
+    "split_long_pdfs": False,
     "use_flash_attention": False,
     # Output
-    "output_directory": lambda: str(Path.home() / "Documents"),
+    "output_directory": config.DEFAULT_OUTPUT_DIR,
     "create_subfolder": False,
     "overwrite_files": False,
+    "skip_converted": False,
 }
 
 
-def _resolve_default(default):
-    """Evaluate a callable default, otherwise return it unchanged."""
-    return default() if callable(default) else default
+# How often the progress bar is redrawn during a conversion (see
+# DoclingGUI._progress_tick).
+PROGRESS_TICK_MS = 50
+
+# Quiet time after the last file-list selection change before its info is
+# looked up (see on_file_select).
+SELECT_DEBOUNCE_MS = 120
+
+# How often the parallel conversion loop checks for a cancel request.
+CANCEL_POLL_SECONDS = 0.5
+
+# Retries for documents that fail with a transient error (see
+# is_transient_error); the wait doubles from MIN up to MAX between attempts.
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_MIN = 1.0
+RETRY_BACKOFF_MAX = 16.0
+
+# Files added per main-loop slice when scanning a folder (see add_folder).
+FOLDER_SLICE = 500
 
 
 def _make_var(default):
-    """Create the appropriate tk variable for a resolved default value."""
+    """Create the appropriate tk variable for a default value."""
     # bool must be checked before int, since bool is a subclass of int.
     if isinstance(default, bool):
         return tk.BooleanVar(value=default)
@@ -100,6 +162,130 @@ def _make_var(default):
     return tk.StringVar(value=str(default))
 
 
+def _index_runs(indices):
+    """Collapse sorted indices into inclusive (first, last) runs."""
+    runs = []
+    for index in indices:
+        if runs and index == runs[-1][1] + 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return runs
+
+
+def _is_supported(name):
+    """True if a file name or path has a supported extension (any case)."""
+    return name.lower().endswith(config.SUPPORTED_EXT_TUPLE)
+
+
+def _iter_supported_files(folder):
+    """Yield the path of every supported file under ``folder``, recursively,
+    and return the number of unsupported files passed over.
+
+    Walks with ``os.scandir`` and an explicit stack rather than ``os.walk``:
+    each DirEntry caches its file type from the directory read, so no extra
+    stat is needed per entry. Like ``os.walk``, symlinked directories are not
+    followed and unreadable directories are skipped.
+    """
+    unsupported = 0
+    stack = [folder]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if _is_supported(entry.name):
+                        yield entry.path
+                    else:
+                        unsupported += 1
+        except OSError:
+            continue
+        # Reversed so subdirectories are visited in listing order.
+        stack.extend(reversed(subdirs))
+    return unsupported
+
+
+def _split_encrypted(files):
+    """Split paths into (plain, encrypted), keeping order; encrypted = locked PDFs.
+
+    Encryption is detected up front via pypdfium2 because Docling swallows
+    the underlying PDFium password error and only reports the document as
+    "not valid" - so it cannot be reliably detected from a failed conversion.
+    """
+    plain = []
+    encrypted = []
+    for filepath in files:
+        if filepath.lower().endswith('.pdf') and pdf_needs_password(filepath):
+            encrypted.append(filepath)
+        else:
+            plain.append(filepath)
+    return plain, encrypted
+
+
+class FileEntry:
+    """An input file in the list, with its name parts parsed once on add."""
+
+    __slots__ = ('path', 'name', 'ext')
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.ext = os.path.splitext(self.name)[1].lower()
+
+
+def _percent(done, total):
+    """Whole-number percentage of ``done`` out of ``total``.
+
+    Progress is reported in whole percent so the tick only redraws the bar
+    when the visible value moves, not after every file of a large batch.
+    """
+    return done * 100 // total
+
+
+# (upper bound, unit, divisor) for _format_size, smallest unit first.
+_SIZE_UNITS = (
+    (1024, "bytes", 1),
+    (1024 ** 2, "KB", 1024),
+    (1024 ** 3, "MB", 1024 ** 2),
+    (float("inf"), "GB", 1024 ** 3),
+)
+
+
+def _format_size(size):
+    """Human-readable file size, e.g. ``512 bytes`` or ``3.4 MB``."""
+    for limit, unit, divisor in _SIZE_UNITS:
+        if size < limit:
+            if divisor == 1:
+                return f"{size} {unit}"
+            return f"{size / divisor:.1f} {unit}"
+    raise ValueError(f"invalid size: {size!r}")  # only NaN gets here
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_file_info(path, mtime_ns, size):
+    """Format the preview text for the file at ``path``.
+
+    Cached on ``(path, mtime_ns, size)`` so re-selecting a file the user
+    has already viewed skips the formatting, even after it was removed and
+    added again; a modified file gets a new key. ``mtime_ns`` is only part
+    of the key and is not otherwise used.
+    """
+    name = os.path.basename(path)
+    ext = os.path.splitext(name)[1].lower()
+    info = f"File: {name}\n"
+    info += f"Path: {path}\n"
+    info += f"Size: {_format_size(size)}\n"
+    info += f"Type: {config.SUPPORTED_EXTENSIONS.get(ext, 'Unknown')}\n"
+    return info
+
+
 class DoclingGUI:
     """
     Main GUI class for Docling Document Converter.
@@ -132,10 +318,13 @@ class DoclingGUI:
     images_scale: tk.DoubleVar
     device: tk.StringVar
     num_threads: tk.IntVar
+    parallel_files: tk.IntVar
+    split_long_pdfs: tk.BooleanVar
     use_flash_attention: tk.BooleanVar
     output_directory: tk.StringVar
     create_subfolder: tk.BooleanVar
     overwrite_files: tk.BooleanVar
+    skip_converted: tk.BooleanVar
 
     def __init__(self, root):
         self.root = root
@@ -151,19 +340,48 @@ class DoclingGUI:
         # Setup modern theme and styling
         self.setup_theme()
 
-        # File list storage
-        self.file_list = []
+        # File list storage: FileEntry objects in listbox order. file_set holds
+        # their paths for O(1) duplicate checks when adding large folders; the
+        # two are always updated together.
+        self.file_list: list[FileEntry] = []
+        self.file_set = set()
+        # Bumped on every file selection so stale file-info lookups are dropped.
+        self._select_token = 0
+        # Pending debounced selection lookup (see on_file_select).
+        self._select_after = None
+        # Bumped by Clear so folder scans still adding in slices stop early.
+        self._scan_token = 0
 
         # Conversion state
         self.is_converting = False
         self.cancel_requested = False
         self.converter: Any = None
+        # Latest progress reported by the worker, and the value last drawn.
+        self._progress_pct = 0
+        self._progress_shown = 0
+        # Text currently in the preview panel (see _update_preview).
+        self._preview_shown = None
+        # Newest pending status/preview updates (see _post_latest).
+        self._latest: dict[Any, Any] = {}
+        self._latest_lock = threading.Lock()
+        self._latest_flush_scheduled = False
+        # Confidence label text shown and its pending flush (on_conf_scale).
+        self._conf_text = None
+        self._conf_after = None
         # Remembered password for encrypted PDFs, reused across a batch.
         self._pdf_password: Any = None
+        # Converters built for encrypted PDFs, keyed by password, so a batch
+        # of PDFs sharing a password builds its pipeline only once.
+        self._password_converters: dict[str, Any] = {}
+        # Index of already-converted inputs, loaded for the length of a batch,
+        # and this batch's index key per input (see _filter_converted).
+        self._conversion_index: dict[str, str] | None = None
+        self._batch_keys: dict[str, str] = {}
 
         # UI Components (created by gui_panels during layout construction)
+        self.mono_fonts: tuple[tkfont.Font, ...]
         self.file_listbox: tk.Listbox
-        self.context_menu: tk.Menu
+        self.context_menu: tk.Menu | None
         self.file_count_label: ttk.Label
         self.options_notebook: ttk.Notebook
         self.vlm_frame: ttk.Frame
@@ -172,7 +390,6 @@ class DoclingGUI:
         self.preview_notebook: ttk.Notebook
         self.preview_text: tk.Text
         self.log_text: tk.Text
-        self.progress_var: tk.DoubleVar
         self.progress_bar: ttk.Progressbar
         self.progress_label: ttk.Label
         self.status_label: ttk.Label
@@ -184,6 +401,7 @@ class DoclingGUI:
         self.init_variables()
 
         # Build the UI
+        gui_panels.create_fonts(self)
         gui_panels.create_menu(self)
         self.create_main_layout()
 
@@ -201,6 +419,36 @@ class DoclingGUI:
         if not DOCLING_AVAILABLE:
             self.log_message(
                 "WARNING: Docling is not installed. Please run: pip install docling")
+        else:
+            # Import docling once the window is up, so the first conversion
+            # doesn't pay for it.
+            self.root.after_idle(self._start_warmup)
+
+    def _start_warmup(self):
+        """Import docling and cache a converter for the current settings on a
+        background thread."""
+        settings = self.get_current_settings()
+        self.update_status("Loading Docling...")
+        thread = threading.Thread(
+            target=self._warmup_worker, args=(settings,), daemon=True)
+        thread.start()
+
+    def _warmup_worker(self, settings):
+        # Building a converter imports docling and torch but loads no models:
+        # docling creates pipelines on first use, so nothing is downloaded
+        # before the user converts. A conversion started meanwhile waits on
+        # the converter cache and then reuses this converter.
+        try:
+            get_converter(settings)
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Converter warm-up failed", exc_info=True)
+        # RuntimeError: the window was closed while docling was loading.
+        with contextlib.suppress(RuntimeError):
+            self.root.after(0, self._warmup_finished)
+
+    def _warmup_finished(self):
+        if not self.is_converting:
+            self.update_status("Ready")
 
     def setup_theme(self):
         """Setup modern theme and custom styling"""
@@ -249,10 +497,18 @@ class DoclingGUI:
             foreground='#1f2937'
         )
 
+        # Label styles used by gui_panels in place of per-widget options
+        style.configure('Heading.TLabel', font=('', 9, 'bold'))
+        style.configure('Muted.TLabel', foreground='gray')
+        style.configure('Hint.TLabel', foreground='gray', font=('', 8))
+        style.configure('Warning.TLabel', foreground='#b45309', font=('', 8))
+        style.configure(
+            'DnD.TLabel', foreground='#2563eb', font=('', 8, 'italic'))
+
     def init_variables(self):
         """Create every option variable from OPTION_DEFAULTS."""
         for name, default in OPTION_DEFAULTS.items():
-            setattr(self, name, _make_var(_resolve_default(default)))
+            setattr(self, name, _make_var(default))
 
     def get_current_settings(self):
         """Collect current settings into a dictionary"""
@@ -301,9 +557,29 @@ class DoclingGUI:
     def on_ocr_engine_change(self, _=None):
         """Enable the confidence slider only for EasyOCR (the only engine
         that honours it); disable it for RapidOCR/Auto."""
+        # The OCR tab is built lazily and syncs the slider itself when built.
+        if not hasattr(self, "conf_scale"):
+            return
         state = tk.NORMAL if self.ocr_engine.get() == "EasyOCR" else tk.DISABLED
         self.conf_scale.config(state=state)
 
+    def on_conf_scale(self, *_):
+        """Update the confidence label, at most ~30 times/sec.
+
+        Traces the option variable, so the label also follows a reset or
+        loaded settings. A slider drag writes it on every pixel; the label is
+        only redrawn on the next flush, and only if its text changed.
+        """
+        if self._conf_after is None:
+            self._conf_after = self.root.after(33, self._flush_conf_label)
+
+    def _flush_conf_label(self):
+        self._conf_after = None
+        text = f"{self.ocr_confidence.get():.2f}"
+        if text != self._conf_text:
+            self._conf_text = text
+            self.conf_label.config(text=text)
+
     def on_picture_description_toggle(self):
         """
         Warn about the large model download when Picture Description is enabled.
@@ -359,7 +635,7 @@ class DoclingGUI:
     def reset_options(self):
         """Reset all options to defaults by updating existing variables"""
         for name, default in OPTION_DEFAULTS.items():
-            getattr(self, name).set(_resolve_default(default))
+            getattr(self, name).set(default)
 
         # Hide VLM frame if shown
         self.vlm_frame.pack_forget()
@@ -375,61 +651,119 @@ class DoclingGUI:
 
     def add_files(self):
         """Open file dialog to add files"""
-        filetypes = [
-            ("All Supported", " ".join(
-                f"*{ext}" for ext in config.SUPPORTED_EXTENSIONS)),
-            ("PDF Files", "*.pdf"),
-            ("Word Documents", "*.docx"),
-            ("PowerPoint", "*.pptx"),
-            ("Excel", "*.xlsx"),
-            ("HTML Files", "*.html *.htm"),
-            ("Images", "*.png *.jpg *.jpeg *.tiff *.tif *.bmp"),
-            ("Audio Files", "*.wav *.mp3"),
-            ("All Files", "*.*")
-        ]
-
         files = filedialog.askopenfilenames(
             title="Select Files",
-            filetypes=filetypes
+            filetypes=config.FILE_DIALOG_TYPES
         )
 
-        for file in files:
-            self.add_file_to_list(file)
+        self._log_unsupported(files)
+        self.add_files_to_list(files)
 
     def add_folder(self):
         """Add all supported files from a folder"""
         folder = filedialog.askdirectory(title="Select Folder")
         if folder:
-            count = 0
-            for root, _, files in os.walk(folder):
-                for file in files:
-                    ext = os.path.splitext(file)[1].lower()
-                    if ext in config.SUPPORTED_EXTENSIONS:
-                        self.add_file_to_list(os.path.join(root, file))
-                        count += 1
-            self.log_message(f"Added {count} files from folder")
-
-    def add_file_to_list(self, filepath):
-        """Add a single file to the list. Returns True if added."""
-        if filepath not in self.file_list:
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext in config.SUPPORTED_EXTENSIONS:
-                self.file_list.append(filepath)
-                display_name = os.path.basename(filepath)
-                self.file_listbox.insert(tk.END, display_name)
-                self.update_file_count()
-                logger.debug("Added file: %s", filepath)
-                return True
-            else:
+            self._add_in_slices(
+                self._scan_folder(folder),
+                lambda count: self.log_message(f"Added {count} files from folder"))
+
+    def _scan_folder(self, folder):
+        """Yield the supported files under ``folder`` (see
+        _iter_supported_files), then log how many unsupported ones were left
+        out. Runs on the scan thread."""
+        unsupported = yield from _iter_supported_files(folder)
+        if unsupported:
+            self.log_message(
+                f"Skipped {unsupported} unsupported file(s) in {folder}")
+
+    def _add_in_slices(self, paths, on_done):
+        """Add ``paths`` to the list while a background thread produces them.
+
+        The walk (directory reads, which can be slow on network storage) runs
+        on a daemon thread that queues FOLDER_SLICE paths at a time; the main
+        loop adds one slice per turn so the window stays responsive and the
+        file count updates as the scan proceeds. ``on_done`` is called with
+        the number of files added at the end. A Clear while the scan is
+        running stops both sides without calling ``on_done``.
+        """
+        token = self._scan_token
+        batches = queue.Queue()
+        threading.Thread(
+            target=self._scan_worker,
+            args=(paths, batches, token),
+            daemon=True,
+        ).start()
+        self.root.after(1, self._drain_scan, batches, on_done, 0, token)
+
+    def _scan_worker(self, paths, batches, token):
+        """Queue ``paths`` in slices until exhausted or the scan is cleared."""
+        try:
+            while token == self._scan_token:
+                batch = list(itertools.islice(paths, FOLDER_SLICE))
+                if batch:
+                    batches.put(batch)
+                if len(batch) < FOLDER_SLICE:
+                    break
+        finally:
+            batches.put(None)  # end of scan
+
+    def _drain_scan(self, batches, on_done, count, token):
+        """Add the next queued slice (main thread), then reschedule."""
+        if token != self._scan_token:
+            return
+        try:
+            batch = batches.get_nowait()
+        except queue.Empty:
+            self.root.after(PROGRESS_TICK_MS, self._drain_scan,
+                            batches, on_done, count, token)
+            return
+        if batch is None:
+            on_done(count)
+            return
+        count += self.add_files_to_list(batch)
+        self.root.after(1, self._drain_scan, batches, on_done, count, token)
+
+    def _log_unsupported(self, filepaths):
+        """Log each explicitly chosen file that has an unsupported type."""
+        for filepath in filepaths:
+            if not _is_supported(filepath):
                 self.log_message(f"Unsupported file type: {filepath}")
-        return False
+
+    def add_files_to_list(self, filepaths):
+        """Add many files at once. Returns the number added.
+
+        Unsupported and already-listed paths are skipped silently. New
+        entries go into the listbox in bulk (see gui_panels.listbox_insert_many)
+        and the file count is updated once.
+        """
+        new_entries = []
+        for filepath in filepaths:
+            if filepath in self.file_set:
+                continue
+            if _is_supported(filepath):
+                new_entries.append(FileEntry(filepath))
+                self.file_set.add(filepath)
+
+        if new_entries:
+            self.file_list.extend(new_entries)
+            gui_panels.listbox_insert_many(
+                self.file_listbox, [entry.name for entry in new_entries])
+            self.update_file_count()
+            logger.debug("Added %d file(s)", len(new_entries))
+        return len(new_entries)
 
     def remove_selected(self):
         """Remove selected files from the list"""
         selection = self.file_listbox.curselection()
-        for index in reversed(selection):
-            self.file_listbox.delete(index)
-            del self.file_list[index]
+        # Delete contiguous runs from the bottom up so earlier indices stay
+        # valid, then rebuild file_list in one pass rather than shifting it
+        # once per removed item.
+        for first, last in reversed(_index_runs(selection)):
+            self.file_listbox.delete(first, last)
+        removed = set(selection)
+        self.file_set.difference_update(self.file_list[i].path for i in removed)
+        self.file_list = [
+            entry for i, entry in enumerate(self.file_list) if i not in removed]
         if selection:
             self.log_message(f"Removed {len(selection)} file(s) from the list")
         self.update_file_count()
@@ -437,8 +771,10 @@ class DoclingGUI:
     def clear_files(self):
         """Clear all files from the list"""
         count = len(self.file_list)
+        self._scan_token += 1
         self.file_listbox.delete(0, tk.END)
         self.file_list.clear()
+        self.file_set.clear()
         self.update_file_count()
         if count:
             self.log_message(f"Cleared {count} file(s) from the list")
@@ -450,56 +786,71 @@ class DoclingGUI:
             text=f"{count} file{'s' if count != 1 else ''}")
 
     def on_file_select(self, _):
-        """Handle file selection for preview"""
+        """Show info for the selected file once the selection settles.
+
+        Arrowing through the list fires an event per key press; the lookup
+        runs SELECT_DEBOUNCE_MS after the last one, for the file the user
+        stopped on, instead of once per file passed over.
+        """
+        if self._select_after is not None:
+            self.root.after_cancel(self._select_after)
+        self._select_after = self.root.after(
+            SELECT_DEBOUNCE_MS, self._show_selected)
+
+    def _show_selected(self):
+        self._select_after = None
         try:
             selection = self.file_listbox.curselection()
             if selection:
                 index = selection[0]
                 if index < len(self.file_list):
-                    filepath = self.file_list[index]
-                    self.show_file_info(filepath)
+                    self.show_file_info(self.file_list[index])
         except Exception as e:  # pylint: disable=broad-except
             self.log_error(f"Selection error: {e}")
 
-    def show_file_info(self, filepath):
-        """Show file info in preview panel"""
+    def show_file_info(self, entry):
+        """Show info for a FileEntry in the preview panel.
+
+        The stat runs on a worker thread so a file on slow or network storage
+        can't stall the UI while the user arrows through the list. Each call
+        takes a new selection token; results for an older selection are
+        dropped when they arrive.
+        """
+        self._select_token += 1
+        threading.Thread(
+            target=self._file_info_worker,
+            args=(entry, self._select_token),
+            daemon=True,
+        ).start()
+
+    def _file_info_worker(self, entry, token):
+        """Stat a file off the UI thread and post its info back to the preview."""
         try:
-            if not os.path.exists(filepath):
-                self.log_message(f"File not found: {filepath}")
-                return
+            stat = os.stat(entry.path)
+        except FileNotFoundError:
+            self.log_message(f"File not found: {entry.path}")
+            return
+        except Exception as e:  # pylint: disable=broad-except
+            self.log_error(f"Error reading file info: {e}")
+            # Show error in preview window as well
+            self.root.after(0, self._apply_file_info, token,
+                            f"Error reading file info: {e}", False)
+            return
 
-            stat = os.stat(filepath)
-            size = stat.st_size
-            if size < 1024:
-                size_str = f"{size} bytes"
-            elif size < 1024 * 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
+        info = _format_file_info(entry.path, stat.st_mtime_ns, stat.st_size)
+        self.root.after(0, self._apply_file_info, token, info, True)
 
-            ext = os.path.splitext(filepath)[1].lower()
-            info = f"File: {os.path.basename(filepath)}\n"
-            info += f"Path: {filepath}\n"
-            info += f"Size: {size_str}\n"
-            info += f"Type: {config.SUPPORTED_EXTENSIONS.get(ext, 'Unknown')}\n"
+    def _apply_file_info(self, token, info, select_tab):
+        """Write file info into the preview (main thread) unless superseded."""
+        if token != self._select_token:
+            return  # the user has since selected another file
 
-            self.preview_text.config(state=tk.NORMAL)
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(tk.END, info)
-            self.preview_text.config(state=tk.DISABLED)
+        self._update_preview(info)
 
-            # Switch to preview tab if not already there
+        # Switch to preview tab if not already there
+        if select_tab:
             self.preview_notebook.select(0)
 
-        except Exception as e:  # pylint: disable=broad-except
-            self.log_error(f"Error reading file info: {e}")
-
-            # Show error in preview window as well
-            self.preview_text.config(state=tk.NORMAL)
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(tk.END, f"Error reading file info: {e}")
-            self.preview_text.config(state=tk.DISABLED)
-
     def show_context_menu(self, event):
         """Show right-click context menu"""
         try:
@@ -507,19 +858,18 @@ class DoclingGUI:
             self.file_listbox.selection_set(
                 self.file_listbox.nearest(event.y))
             self.file_listbox.activate(self.file_listbox.nearest(event.y))
+            if self.context_menu is None:
+                gui_panels.create_context_menu(self)
             self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            self.context_menu.grab_release()
+            if self.context_menu is not None:
+                self.context_menu.grab_release()
 
     def open_in_explorer(self):
         """Open selected file location in Explorer/Finder"""
         selection = self.file_listbox.curselection()
         if selection:
-            folder = os.path.dirname(self.file_list[selection[0]])
-            if os.name == 'nt':
-                os.startfile(folder)
-            elif os.name == 'posix':
-                subprocess.run(['open', folder], check=False)
+            self._open_path(os.path.dirname(self.file_list[selection[0]].path))
 
     def browse_output_dir(self):
         """Browse for output directory"""
@@ -532,6 +882,35 @@ class DoclingGUI:
         """Set default output directory"""
         self.browse_output_dir()
 
+    def forget_converted_files(self):
+        """Clear the index of converted inputs so every file converts again."""
+        if self.is_converting:
+            messagebox.showinfo(
+                "Conversion Running",
+                "Wait for the current conversion to finish first.")
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(config.CONVERSION_INDEX_FILE)
+        self.log_message("Forgot previously converted files")
+
+    def release_models(self):
+        """Unload the cached converters so their models free RAM/VRAM.
+
+        The next conversion loads them again.
+        """
+        if self.is_converting:
+            messagebox.showinfo(
+                "Conversion Running",
+                "Wait for the current conversion to finish first.")
+            return
+        if not clear_converter_cache():
+            # The start-up warm-up is still importing docling.
+            self.update_status("Docling is still loading; try again shortly")
+            return
+        self.converter = None
+        self._password_converters.clear()
+        self.log_message("Released loaded models")
+
     # ==================== Drag and Drop Support ====================
 
     def setup_drag_drop(self):
@@ -572,23 +951,22 @@ class DoclingGUI:
         # Remove visual feedback
         self.file_listbox.config(background='white')
 
-        # Get dropped files/folders
-        files = self.root.tk.splitlist(event.data)
-
-        added_count = 0
-        for item in files:
-            # Clean up the path (remove curly braces if present)
-            item = item.strip('{}')
-
-            if os.path.isfile(item):
-                if self.add_file_to_list(item):
-                    added_count += 1
-            elif os.path.isdir(item):
-                for root, _, dir_files in os.walk(item):
-                    for file in dir_files:
-                        if self.add_file_to_list(os.path.join(root, file)):
-                            added_count += 1
-
+        # Get dropped files/folders, cleaning up the paths (remove curly
+        # braces if present)
+        items = [item.strip('{}') for item in self.root.tk.splitlist(event.data)]
+        dropped_files = [item for item in items if os.path.isfile(item)]
+        dropped_dirs = [item for item in items if os.path.isdir(item)]
+        self._log_unsupported(dropped_files)
+
+        # Files first, then the folders' contents, added in slices like a
+        # folder added from the menu.
+        paths = itertools.chain(
+            dropped_files,
+            itertools.chain.from_iterable(
+                self._scan_folder(folder) for folder in dropped_dirs))
+        self._add_in_slices(paths, self._report_drop)
+
+    def _report_drop(self, added_count):
         if added_count > 0:
             self.log_message(f"Added {added_count} file(s) via drag & drop")
         else:
@@ -604,7 +982,7 @@ class DoclingGUI:
                 "No Selection", "Please select files to convert.")
             return
 
-        files = [self.file_list[i] for i in selection]
+        files = [self.file_list[i].path for i in selection]
         self.start_conversion(files)
 
     def convert_all(self):
@@ -613,7 +991,7 @@ class DoclingGUI:
             messagebox.showwarning("No Files", "Please add files to convert.")
             return
 
-        self.start_conversion(self.file_list.copy())
+        self.start_conversion([entry.path for entry in self.file_list])
 
     def start_conversion(self, files):
         """Start the conversion process in a separate thread"""
@@ -626,12 +1004,12 @@ class DoclingGUI:
             return
 
         self.is_converting = True
+        # Start from 0%, not where the previous batch finished.
+        self._progress_pct = 0
+        self._progress_tick()
         self.cancel_requested = False
 
-        # Update UI state
-        self.convert_selected_btn.config(state=tk.DISABLED)
-        self.convert_all_btn.config(state=tk.DISABLED)
-        self.cancel_btn.config(state=tk.NORMAL)
+        self._set_controls_running(True)
 
         # Switch to log tab
         self.preview_notebook.select(1)
@@ -658,7 +1036,8 @@ class DoclingGUI:
             )
             self.log_message(f"Table Mode: {settings['table_mode']}")
             self.log_message(
-                f"Device: {settings['device']}, Threads: {settings['num_threads']}")
+                f"Device: {settings['device']}, Threads: {settings['num_threads']}, "
+                f"Parallel files: {settings['parallel_files']}")
             self.log_message("================================")
 
             # Full detail to the file only, for after-the-fact debugging.
@@ -666,116 +1045,409 @@ class DoclingGUI:
                          len(files), [os.path.basename(f) for f in files])
             logger.debug("Full settings: %s", settings)
 
-            # Build converter with proper pipeline type
-            self.converter, pipeline_name = build_converter(settings)
-            self.log_message(f"Using {pipeline_name} pipeline")
+            # Skip inputs whose output from an earlier run is still there.
+            self._conversion_index = conversion_cache.load_index(
+                config.CONVERSION_INDEX_FILE)
+            files, skipped = self._filter_converted(files, settings)
 
-            total = len(files)
-            successful = 0
-            failed = 0
+            convert_kwargs = build_convert_kwargs(settings)
+            # Create the output directory up front: an unwritable location
+            # then fails at once instead of after the models have loaded.
+            os.makedirs(settings['output_directory'], exist_ok=True)
+            self._password_converters.clear()
 
-            for i, filepath in enumerate(files):
-                if self.cancel_requested:
-                    self.log_message("Conversion cancelled by user")
-                    break
+            if files:
+                successful, failed = self._convert_batch(
+                    files, settings, convert_kwargs)
+            else:
+                successful = failed = 0
+                self.update_progress(100)
 
-                filename = os.path.basename(filepath)
-                self.update_status(f"Converting: {filename}")
-                self.log_message(f"Converting: {filename}")
+            # Final summary
+            self.log_message("\n=== Conversion Complete ===")
+            self.log_message(f"Successful: {successful}")
+            self.log_message(f"Failed: {failed}")
+            if skipped:
+                self.log_message(f"Skipped (already converted): {skipped}")
+            self.log_message("===========================")
 
-                try:
-                    # Apply page limit (first N pages) if set; 0 = all pages
-                    convert_kwargs = {}
-                    max_pages = settings.get('max_pages', 0)
-                    if max_pages and max_pages > 0:
-                        convert_kwargs['page_range'] = (1, max_pages)
+        except Exception as e:  # pylint: disable=broad-except
+            self.log_error(f"Conversion error: {e}")
 
-                    # Apply max file size limit (MB -> bytes); 0 = unlimited
-                    max_file_size_mb = settings.get('max_file_size_mb', 0)
-                    if max_file_size_mb and max_file_size_mb > 0:
-                        convert_kwargs['max_file_size'] = max_file_size_mb * 1024 * 1024
+        finally:
+            if self._conversion_index is not None:
+                conversion_cache.save_index(
+                    self._conversion_index, config.CONVERSION_INDEX_FILE)
+                self._conversion_index = None
+            self.is_converting = False
+            self.root.after(0, self.conversion_finished)
 
-                    # Convert the document (prompts for a password if encrypted)
-                    result = self._convert_document(
-                        filepath, convert_kwargs, settings, filename)
+    def _filter_converted(self, files, settings):
+        """
+        Record each input's index key for this batch and, when skipping is
+        enabled and overwriting is not, drop inputs whose earlier output
+        still exists.
 
-                    # Export based on selected format
-                    output_format = settings['output_format']
-                    output_ext = get_output_extension(output_format)
+        Returns (files_to_convert, skipped_count).
+        """
+        digest = conversion_cache.settings_digest(settings)
+        # "Overwrite existing" asks for every output to be regenerated.
+        skip = settings['skip_converted'] and not settings['overwrite_files']
+        self._batch_keys = {}
+        remaining = []
+        for filepath in files:
+            key = conversion_cache.key_for(filepath, digest)
+            if key is None:
+                remaining.append(filepath)
+                continue
+            self._batch_keys[conversion_cache.normalize_path(filepath)] = key
+            if skip:
+                output_path = conversion_cache.cached_output(
+                    self._conversion_index, key)
+                if output_path:
+                    self.log_message(
+                        f"Skipped: {os.path.basename(filepath)} "
+                        f"(already converted to {output_path})")
+                    continue
+            remaining.append(filepath)
+        return remaining, len(files) - len(remaining)
+
+    def _mark_converted(self, filepath, output_path):
+        """Record a successful conversion in the index (see _filter_converted)."""
+        key = self._batch_keys.get(conversion_cache.normalize_path(filepath))
+        if key is not None:
+            conversion_cache.mark_done(self._conversion_index, key, output_path)
+
+    def _convert_batch(self, files, settings, convert_kwargs):
+        """Convert ``files`` in worker processes or on this thread, depending
+        on the settings. Returns (successful, failed)."""
+        total = len(files)
+        splits = plan_page_splits(files, settings)
+        for filepath, ranges in splits.items():
+            self.log_message(
+                f"Splitting {os.path.basename(filepath)} into {len(ranges)} "
+                "page ranges")
+        # Each extra page range is one more task for the process pool.
+        tasks = total + sum(len(ranges) - 1 for ranges in splits.values())
+        workers = parallel_worker_count(settings, tasks)
+        if workers > 1:
+            return self._convert_parallel(
+                files, settings, convert_kwargs, workers, splits)
+
+        # Build converter with proper pipeline type, or reuse the one
+        # from an earlier batch with the same settings. The settings
+        # dict is a snapshot taken on the UI thread, so nothing here
+        # touches tk vars. The first call imports docling (torch
+        # included), which takes a few seconds, so say so.
+        self.update_status("Loading Docling...")
+        # Meanwhile, start reading the first inputs into the OS cache.
+        threading.Thread(
+            target=prefetch_files,
+            args=(files[:PREFETCH_FILES],),
+            daemon=True,
+        ).start()
+        started = time.monotonic()
+        self.converter, pipeline_name = get_converter(settings)
+        if self.converter is None:
+            raise RuntimeError(
+                "Docling could not be imported; see the log file for details")
+        load_seconds = time.monotonic() - started
+        if load_seconds >= 1.0:  # not a converter reused from the cache
+            self.log_message(f"Loaded models in {load_seconds:.1f}s")
+        self.log_message(f"Using {pipeline_name} pipeline")
+        # On GPU, "parallel files" become threads sharing this
+        # converter instead of processes each loading the models.
+        threads = thread_document_count(settings, total)
+        if threads > 1:
+            self.log_message(f"Converting up to {threads} files at once")
+        # Outputs are written on a background thread while the next
+        # document converts; leaving the block waits for the writes.
+        with OutputWriter() as writer, document_concurrency(threads):
+            successful, failed = self._convert_streamed(
+                files, settings, convert_kwargs, writer)
+        for path, error in writer.failed:
+            logger.error("  ERROR writing %s: %s", path, error)
+        if writer.failed and self._conversion_index is not None:
+            # These were recorded when queued; an older file at the same
+            # path must not make the next run skip the input.
+            conversion_cache.forget_outputs(
+                self._conversion_index, [path for path, _ in writer.failed])
+        return successful - len(writer.failed), failed + len(writer.failed)
+
+    def _convert_streamed(self, files, settings, convert_kwargs, writer):
+        """
+        Convert files through one ``convert_all`` stream on this worker thread.
 
-                    # Determine output path
-                    base_name = os.path.splitext(filename)[0]
-                    output_dir = settings['output_directory']
+        Handing docling the whole batch lets it pipeline work across documents
+        instead of starting each one from scratch. Encrypted PDFs need a
+        password prompt and their own converter, so they are converted
+        afterwards one at a time. Outputs are queued on ``writer``.
+        Returns (successful, failed).
+        """
+        total = len(files)
+        plain, encrypted = _split_encrypted(files)
+        successful = 0
+        failed = 0
+        done = 0
+
+        if plain:
+            self.update_status(f"Converting {len(plain)} file(s)")
+            results = self.converter.convert_all(
+                plain, raises_on_error=False, **convert_kwargs)
+            try:
+                for result in results:
+                    filepath = os.fspath(result.input.file)
+                    filename = os.path.basename(filepath)
+                    try:
+                        error = result_error(result)
+                        if error:
+                            result = self._retry_transient(
+                                self.converter, filepath, convert_kwargs, error)
+                        output_path, preview = save_output(
+                            result, filepath, settings, writer)
+                        self._mark_converted(filepath, output_path)
+                        self.log_message(f"Converted: {filename}")
+                        self.log_message(f"  Saved: {output_path}")
+                        successful += 1
+                        self.update_preview(preview)
+                    except Exception as e:  # pylint: disable=broad-except
+                        self.log_error(f"  ERROR converting {filename}: {e}")
+                        failed += 1
+                    # Release the document before docling converts the next.
+                    result = None
+
+                    done += 1
+                    self.update_progress(_percent(done, total))
+
+                    if self.cancel_requested:
+                        break
+            finally:
+                # Stop docling from starting on the rest of the batch.
+                results.close()
+
+        if self.cancel_requested:
+            self.log_message("Conversion cancelled by user")
+            return successful, failed
+
+        if encrypted:
+            enc_successful, enc_failed = self._convert_encrypted(
+                encrypted, settings, convert_kwargs, done, total, writer)
+            successful += enc_successful
+            failed += enc_failed
+
+        return successful, failed
+
+    def _convert_encrypted(self, files, settings, convert_kwargs, done, total,
+                           writer=None, output_paths=None):
+        """
+        Convert encrypted PDFs one at a time on this worker thread, prompting
+        for passwords as needed.
 
-                    if settings['create_subfolder']:
-                        output_dir = os.path.join(output_dir, base_name)
+        ``done`` is how many files of the ``total`` in the batch were already
+        processed, for progress reporting. Outputs are queued on ``writer``
+        if given, else written directly, to the paths in ``output_paths``
+        (see resolve_output_paths) if given. Returns (successful, failed).
+        """
+        successful = 0
+        failed = 0
 
-                    os.makedirs(output_dir, exist_ok=True)
+        for filepath in files:
+            if self.cancel_requested:
+                self.log_message("Conversion cancelled by user")
+                break
 
-                    output_path = os.path.join(
-                        output_dir, f"{base_name}{output_ext}")
+            filename = os.path.basename(filepath)
+            self.update_status(f"Converting: {filename}")
+            self.log_message(f"Converting: {filename}")
 
-                    # Check for overwrite
-                    if os.path.exists(output_path) and not settings['overwrite_files']:
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        output_path = os.path.join(
-                            output_dir, f"{base_name}_{timestamp}{output_ext}"
-                        )
+            try:
+                result = self._convert_encrypted_pdf(
+                    filepath, convert_kwargs, settings, filename)
 
-                    # Export content
-                    content = export_content(result, output_format)
+                output_path, preview = save_output(
+                    result, filepath, settings, writer,
+                    (output_paths or {}).get(filepath))
+                self._mark_converted(filepath, output_path)
+                self.log_message(f"  Saved: {output_path}")
+                successful += 1
 
-                    # Write to file
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                # Update preview with last converted content
+                self.update_preview(preview)
 
-                    self.log_message(f"  Saved: {output_path}")
-                    successful += 1
+            except Exception as e:  # pylint: disable=broad-except
+                self.log_error(f"  ERROR converting {filename}: {e}")
+                failed += 1
+            # Release the document before the next one is converted.
+            result = None
 
-                    # Update preview with last converted content
-                    self.update_preview(content[:5000])  # Limit preview size
+            # Update progress
+            done += 1
+            self.update_progress(_percent(done, total))
 
-                except Exception as e:  # pylint: disable=broad-except
-                    self.log_error(f"  ERROR converting {filename}: {e}")
-                    failed += 1
+        return successful, failed
 
-                # Update progress
-                progress = ((i + 1) / total) * 100
-                self.update_progress(progress)
+    def _convert_parallel(self, files, settings, convert_kwargs, workers,
+                          splits):
+        """
+        Convert files across a pool of worker processes.
+
+        Each process builds its own converter once and writes its outputs
+        directly, to paths picked here up front so that no two files of the
+        batch share one; logging and progress stay on this thread. A PDF in
+        ``splits`` is instead converted as separate page ranges, whose exports
+        are joined and written here once the last one finishes. Encrypted PDFs
+        need an interactive password prompt, so they are converted afterwards
+        on this thread instead. Returns (successful, failed).
+        """
+        total = len(files)
+        pooled, encrypted = _split_encrypted(files)
+        output_paths = resolve_output_paths(files, settings)
+
+        # Split the thread budget so N processes don't each start a full set
+        # of torch threads and oversubscribe the CPU.
+        worker_settings = {
+            **settings,
+            'num_threads': max(1, settings['num_threads'] // workers),
+        }
+        self.log_message(
+            f"Using {settings['pipeline_type']} pipeline in {workers} "
+            f"parallel processes ({worker_settings['num_threads']} thread(s) each)")
+
+        successful = 0
+        failed = 0
+        done = 0
+
+        if pooled:
+            self.update_status(f"Converting {len(pooled)} file(s) in parallel")
+            # spawn gives each worker a fresh interpreter, so torch/docling
+            # initialise cleanly (forking a threaded process is unsafe).
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker_process,
+                initargs=(worker_settings,),
+            ) as pool:
+                # future -> (filepath, index of its page range or None).
+                futures = {}
+                # Exports of each split PDF's ranges, filled in as they finish.
+                parts = {}
+                for filepath in pooled:
+                    ranges = splits.get(filepath)
+                    if not ranges:
+                        future = pool.submit(convert_in_worker_process, filepath,
+                                             worker_settings, convert_kwargs,
+                                             output_paths[filepath])
+                        futures[future] = (filepath, None)
+                        continue
+                    parts[filepath] = [None] * len(ranges)
+                    for index, pages in enumerate(ranges):
+                        future = pool.submit(convert_pages_in_worker_process,
+                                             filepath, worker_settings,
+                                             convert_kwargs, pages)
+                        futures[future] = (filepath, index)
+                # Wait with a timeout rather than blocking in as_completed, so a
+                # cancel is noticed promptly even while long files are running.
+                pending = set(futures)
+                while pending and not self.cancel_requested:
+                    finished, pending = wait(
+                        pending, timeout=CANCEL_POLL_SECONDS,
+                        return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        filepath, index = futures[future]
+                        filename = os.path.basename(filepath)
+                        if index is not None and filepath not in parts:
+                            continue  # another range of this PDF failed
+                        try:
+                            if index is None:
+                                output_path, preview = future.result()
+                            else:
+                                ranges = parts[filepath]
+                                ranges[index] = future.result()
+                                if any(part is None for part in ranges):
+                                    continue  # wait for the other ranges
+                                del parts[filepath]
+                                output_path, preview = save_joined_output(
+                                    ranges, filepath, settings,
+                                    output_paths[filepath])
+                            self._mark_converted(filepath, output_path)
+                            self.log_message(f"Converted: {filename}")
+                            self.log_message(f"  Saved: {output_path}")
+                            successful += 1
+                            self.update_preview(preview)
+                        except Exception as e:  # pylint: disable=broad-except
+                            self.log_error(f"  ERROR converting {filename}: {e}")
+                            failed += 1
+                            parts.pop(filepath, None)
+
+                        done += 1
+                        self.update_progress(_percent(done, total))
 
-            # Final summary
-            self.log_message("\n=== Conversion Complete ===")
-            self.log_message(f"Successful: {successful}")
-            self.log_message(f"Failed: {failed}")
-            self.log_message("===========================")
+                if self.cancel_requested:
+                    # Queued files are dropped; files already running finish.
+                    pool.shutdown(wait=False, cancel_futures=True)
 
-        except Exception as e:  # pylint: disable=broad-except
-            self.log_error(f"Conversion error: {e}")
+        if self.cancel_requested:
+            self.log_message("Conversion cancelled by user")
+            return successful, failed
 
-        finally:
-            self.is_converting = False
-            self.root.after(0, self.conversion_finished)
+        if encrypted:
+            enc_successful, enc_failed = self._convert_encrypted(
+                encrypted, settings, convert_kwargs, done, total,
+                output_paths=output_paths)
+            successful += enc_successful
+            failed += enc_failed
+
+        return successful, failed
 
-    def _convert_document(self, filepath, convert_kwargs, settings, filename):
+    def _convert_encrypted_pdf(self, filepath, convert_kwargs, settings, filename):
         """
-        Convert a document, prompting for a password if the PDF is encrypted.
+        Convert an encrypted PDF, prompting for its password.
 
-        Encryption is detected up front via pypdfium2 because Docling swallows
-        the underlying PDFium password error and only reports the document as
-        "not valid" - so we cannot reliably detect it from the raised exception.
         Once the password is known, a converter that opens PDFs via the pypdfium2
         backend with that password is built (the default docling-parse backend
         cannot read encrypted PDFs even with the correct password).
-        A working password is remembered for the rest of the batch.
+        A working password is remembered for the rest of the batch, along with
+        the converter built for it.
         """
-        ext = os.path.splitext(filepath)[1].lower()
-        if ext == '.pdf' and pdf_needs_password(filepath):
-            password = self._resolve_pdf_password(filepath, filename)
-            converter: Any
+        password = self._resolve_pdf_password(filepath, filename)
+        converter: Any = self._password_converters.get(password)
+        if converter is None:
             converter, _ = build_converter(settings, password=password)
-            return converter.convert(filepath, **convert_kwargs)
+            self._password_converters[password] = converter
+        result = converter.convert(filepath, raises_on_error=False, **convert_kwargs)
+        error = result_error(result)
+        if error:
+            result = self._retry_transient(converter, filepath, convert_kwargs, error)
+        return result
+
+    def _retry_transient(self, converter, filepath, convert_kwargs, error):
+        """
+        Re-convert a document whose conversion failed with ``error``, while the
+        failure looks transient, waiting longer before each attempt.
+
+        Returns the first successful result. Raises RuntimeError with the last
+        error if it is not transient, the attempts run out, or the user
+        cancels while waiting.
+        """
+        delay = RETRY_BACKOFF_MIN
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            if not is_transient_error(error):
+                break
+            self.log_message(
+                f"  Transient error, retrying in {delay:g}s "
+                f"({attempt}/{RETRY_ATTEMPTS}): {error}")
+            deadline = time.monotonic() + delay
+            while not self.cancel_requested and time.monotonic() < deadline:
+                time.sleep(max(0.0, min(CANCEL_POLL_SECONDS, deadline - time.monotonic())))
+            if self.cancel_requested:
+                break
+            delay = min(2 * delay, RETRY_BACKOFF_MAX)
 
-        return self.converter.convert(filepath, **convert_kwargs)
+            result = converter.convert(filepath, raises_on_error=False, **convert_kwargs)
+            error = result_error(result)
+            if error is None:
+                return result
+        raise RuntimeError(error)
 
     def _resolve_pdf_password(self, filepath, filename):
         """
@@ -829,24 +1501,53 @@ class DoclingGUI:
 
     def conversion_finished(self):
         """Called when conversion is complete"""
-        self.convert_selected_btn.config(state=tk.NORMAL)
-        self.convert_all_btn.config(state=tk.NORMAL)
-        self.cancel_btn.config(state=tk.DISABLED)
+        self._progress_tick()  # draw the final value; the tick has stopped
+        self._set_controls_running(False)
         self.update_status("Ready")
 
+    def _set_controls_running(self, running):
+        """Enable Cancel while a conversion runs, the Convert buttons otherwise.
+
+        The buttons stay classic tk.Buttons (see setup_theme), and each one
+        is reconfigured only when its state actually changes.
+        """
+        convert_state = tk.DISABLED if running else tk.NORMAL
+        cancel_state = tk.NORMAL if running else tk.DISABLED
+        for button, state in ((self.convert_selected_btn, convert_state),
+                              (self.convert_all_btn, convert_state),
+                              (self.cancel_btn, cancel_state)):
+            if str(button.cget('state')) != state:
+                button.config(state=state)
+
     # ==================== UI Updates ====================
 
     def update_progress(self, value):
-        """Update progress bar (thread-safe)"""
-        self.root.after(0, lambda: self._update_progress(value))
+        """Record conversion progress (thread-safe).
+
+        Only stores the value; _progress_tick draws it, so a worker reporting
+        progress rapidly costs no Tk calls.
+        """
+        self._progress_pct = value
+
+    def _progress_tick(self):
+        """Draw the latest progress, repeating every PROGRESS_TICK_MS while a
+        conversion runs. The widgets are touched only when the value changed."""
+        if self._progress_pct != self._progress_shown:
+            self._progress_shown = self._progress_pct
+            self._update_progress(self._progress_shown)
+        if self.is_converting:
+            self.root.after(PROGRESS_TICK_MS, self._progress_tick)
 
     def _update_progress(self, value):
-        self.progress_var.set(value)
-        self.progress_label.config(text=f"{int(value)}%")
+        self.progress_bar.config(value=value)
+        self.progress_label.config(text=f"{value}%")
 
     def update_status(self, text):
         """Update status label (thread-safe)"""
-        self.root.after(0, lambda: self.status_label.config(text=text))
+        self._post_latest(self._update_status, text)
+
+    def _update_status(self, text):
+        self.status_label.config(text=text)
 
     def log_message(self, message):
         """Log an informational message.
@@ -866,9 +1567,39 @@ class DoclingGUI:
 
     def update_preview(self, content):
         """Update preview panel (thread-safe)"""
-        self.root.after(0, lambda: self._update_preview(content))
+        self._post_latest(self._update_preview, content)
+
+    def _post_latest(self, apply, value):
+        """Have the main thread call ``apply(value)``, keeping only the newest
+        value per ``apply`` when updates arrive faster than the flush.
+
+        Only one flush is scheduled at a time, so a burst of status or
+        preview updates costs one Tk event and one redraw per widget.
+        """
+        with self._latest_lock:
+            self._latest[apply] = value
+            if self._latest_flush_scheduled:
+                return
+            self._latest_flush_scheduled = True
+        self.root.after(PROGRESS_TICK_MS, self._flush_latest)
+
+    def _flush_latest(self):
+        with self._latest_lock:
+            latest = self._latest
+            self._latest = {}
+            self._latest_flush_scheduled = False
+        for apply, value in latest.items():
+            apply(value)
 
     def _update_preview(self, content):
+        """Replace the preview text. Conversion previews arrive already
+        capped at PREVIEW_CHARS (see conversion_utils.save_output).
+
+        Skipped when the text is already shown, e.g. re-selecting a file.
+        """
+        if content == self._preview_shown:
+            return
+        self._preview_shown = content
         self.preview_text.config(state=tk.NORMAL)
         self.preview_text.delete(1.0, tk.END)
         self.preview_text.insert(tk.END, content)
@@ -898,15 +1629,19 @@ class DoclingGUI:
         self._open_path(config.LOG_DIR)
 
     def _open_path(self, path):
-        """Open a file or folder with the OS default handler."""
+        """Open a file or folder with the OS default handler.
+
+        The opener is started without waiting for it, so a slow file manager
+        launch doesn't freeze the window.
+        """
         path = str(path)
         try:
             if os.name == 'nt':
                 os.startfile(path)  # pylint: disable=no-member
             elif sys.platform == 'darwin':
-                subprocess.run(['open', path], check=False)
+                subprocess.Popen(['open', path])  # pylint: disable=consider-using-with
             else:
-                subprocess.run(['xdg-open', path], check=False)
+                subprocess.Popen(['xdg-open', path])  # pylint: disable=consider-using-with
         except OSError as e:
             self.log_error(f"Could not open {path}: {e}")
 
@@ -929,8 +1664,7 @@ class DoclingGUI:
         """Load persisted settings from disk, if present."""
         try:
             if config.SETTINGS_FILE.exists():
-                with open(config.SETTINGS_FILE, encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _loads_json(config.SETTINGS_FILE.read_bytes())
                 self.apply_settings(data)
                 # Sync dependent widget states to the restored values.
                 self.on_pipeline_change()
@@ -941,8 +1675,8 @@ class DoclingGUI:
     def save_settings(self):
         """Persist the current settings to disk."""
         try:
-            with open(config.SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.get_current_settings(), f, indent=2)
+            config.SETTINGS_FILE.write_bytes(
+                _dumps_json(self.get_current_settings()))
         except OSError as e:
             self.log_message(f"Could not save settings: {e}")
 
@@ -1,54 +1,103 @@
 """
 GUI Panels and Layout Components for Docling GUI.
 This module separates the UI construction code from the main controller logic.
+
+pack/grid calls here only record layout requests; Tk lays everything out in
+one pass when the event loop next goes idle. Builders therefore must not call
+update() or update_idletasks(), which would force extra passes mid-build.
 """
+import operator
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
 
 import config
 from tooltip import create_tooltip
 
+# Most items passed to one listbox insert command (see listbox_insert_many).
+LISTBOX_INSERT_CHUNK = 5000
+
+
+# Named monospace fonts for the file list, preview and log. Widgets refer to
+# them by name, so Tk resolves each font once and shares it.
+MONO_FONT = "DoclingMono"
+MONO_FONT_SMALL = "DoclingMonoSmall"
+
+
+def create_fonts(gui):
+    """Create the named fonts; call before building any panel"""
+    # Kept on the gui: Tk deletes a named font when its Font object is freed.
+    gui.mono_fonts = (
+        tkfont.Font(root=gui.root, name=MONO_FONT, family='Consolas', size=10),
+        tkfont.Font(root=gui.root, name=MONO_FONT_SMALL, family='Consolas',
+                    size=9),
+    )
+
+
+def listbox_insert_many(listbox, items):
+    """Append ``items`` to a Listbox with one Tcl insert per
+    LISTBOX_INSERT_CHUNK items rather than one per item.
+
+    Calls Tcl directly, skipping the Listbox.insert wrapper's re-packing of
+    a possibly huge tuple. The chunking bounds the size of a single Tcl
+    argument list, e.g. when thousands of files are picked in a dialog.
+
+    The scrollbars need no special handling: an insert only flags them
+    for update, and Tk calls the scroll commands once, from the idle
+    redraw, however many items went in.
+    """
+    widget = str(listbox)
+    for start in range(0, len(items), LISTBOX_INSERT_CHUNK):
+        listbox.tk.call(widget, 'insert', tk.END,
+                        *items[start:start + LISTBOX_INSERT_CHUNK])
+
+
+# Menu bar contents: (menu label, items). An item is (label, name of the gui
+# attribute to call, accelerator or None); None is a separator.
+_MENUS = (
+    ("File", (
+        ("Add Files...", "add_files", "Ctrl+O"),
+        ("Add Folder...", "add_folder", None),
+        None,
+        ("Clear All Files", "clear_files", None),
+        None,
+        ("Exit", "root.quit", "Alt+F4"),
+    )),
+    ("Settings", (
+        ("Set Default Output Directory...", "set_default_output", None),
+        ("Forget Converted Files", "forget_converted_files", None),
+        ("Release Loaded Models", "release_models", None),
+        None,
+        ("Reset All Options", "reset_options", None),
+    )),
+    ("Help", (
+        ("Docling Documentation", "open_docs", None),
+        None,
+        ("Open Log File", "open_log_file", None),
+        ("Open Log Folder", "open_log_folder", None),
+        None,
+        ("About", "show_about", None),
+    )),
+)
+
 
 def create_menu(gui):
-    """Create the menu bar"""
+    """Create the menu bar from _MENUS"""
     menubar = tk.Menu(gui.root)
     gui.root.config(menu=menubar)
 
-    # File menu
-    file_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="File", menu=file_menu)
-    file_menu.add_command(label="Add Files...",
-                          command=gui.add_files, accelerator="Ctrl+O")
-    file_menu.add_command(label="Add Folder...", command=gui.add_folder)
-    file_menu.add_separator()
-    file_menu.add_command(label="Clear All Files",
-                          command=gui.clear_files)
-    file_menu.add_separator()
-    file_menu.add_command(
-        label="Exit", command=gui.root.quit, accelerator="Alt+F4")
-
-    # Settings menu
-    settings_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="Settings", menu=settings_menu)
-    settings_menu.add_command(
-        label="Set Default Output Directory...", command=gui.set_default_output
-    )
-    settings_menu.add_separator()
-    settings_menu.add_command(
-        label="Reset All Options", command=gui.reset_options)
-
-    # Help menu
-    help_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="Help", menu=help_menu)
-    help_menu.add_command(
-        label="Docling Documentation", command=gui.open_docs)
-    help_menu.add_separator()
-    help_menu.add_command(
-        label="Open Log File", command=gui.open_log_file)
-    help_menu.add_command(
-        label="Open Log Folder", command=gui.open_log_folder)
-    help_menu.add_separator()
-    help_menu.add_command(label="About", command=gui.show_about)
+    for menu_label, items in _MENUS:
+        menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label=menu_label, menu=menu)
+        for item in items:
+            if item is None:
+                menu.add_separator()
+                continue
+            label, command, accelerator = item
+            options = {"accelerator": accelerator} if accelerator else {}
+            menu.add_command(label=label,
+                             command=operator.attrgetter(command)(gui),
+                             **options)
 
     # Keyboard shortcuts
     gui.root.bind('<Control-o>', lambda e: gui.add_files())
@@ -82,12 +131,18 @@ def create_input_panel(gui, parent):
     scrollbar_x = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL)
     scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
 
+    # A plain Listbox only draws the visible rows and supports a bulk insert
+    # (see listbox_insert_many). exportselection=False keeps the file
+    # selection out of the clipboard selection, so selecting text in the
+    # preview or log doesn't deselect files, and selecting many files doesn't
+    # publish the whole list.
     gui.file_listbox = tk.Listbox(
         list_frame,
         selectmode=tk.EXTENDED,
+        exportselection=False,
         yscrollcommand=scrollbar_y.set,
         xscrollcommand=scrollbar_x.set,
-        font=('Consolas', 9)
+        font=MONO_FONT_SMALL
     )
     gui.file_listbox.pack(fill=tk.BOTH, expand=True)
     scrollbar_y.config(command=gui.file_listbox.yview)
@@ -96,12 +151,8 @@ def create_input_panel(gui, parent):
     # Bind selection event
     gui.file_listbox.bind('<<ListboxSelect>>', gui.on_file_select)
 
-    # Right-click context menu
-    gui.context_menu = tk.Menu(gui.file_listbox, tearoff=0)
-    gui.context_menu.add_command(
-        label="Remove", command=gui.remove_selected)
-    gui.context_menu.add_command(
-        label="Open in Explorer", command=gui.open_in_explorer)
+    # Right-click context menu, built on the first right-click
+    gui.context_menu = None
     gui.file_listbox.bind('<Button-3>', gui.show_context_menu)
 
     # Info labels
@@ -114,15 +165,25 @@ def create_input_panel(gui, parent):
     # Drag and drop hint
     ttk.Label(
         info_frame, text="💡 Drag & drop files/folders here",
-        foreground="#2563eb", font=('', 8, 'italic')
+        style='DnD.TLabel'
     ).pack(side=tk.LEFT, padx=(10, 0))
 
     supported_text = "PDF, DOCX, PPTX, XLSX, HTML, Images, Audio"
     ttk.Label(
-        info_frame, text=supported_text, foreground="gray", font=('', 8)
+        info_frame, text=supported_text, style='Hint.TLabel'
     ).pack(side=tk.RIGHT)
 
 
+def create_context_menu(gui):
+    """Create the file list's right-click menu"""
+    gui.context_menu = tk.Menu(gui.file_listbox, tearoff=0)
+    gui.context_menu.add_command(
+        label="Remove", command=gui.remove_selected)
+    gui.context_menu.add_command(
+        label="Open in Explorer", command=gui.open_in_explorer)
+    return gui.context_menu
+
+
 def create_options_panel(gui, parent):
     """Create the tabbed conversion options panel"""
     options_frame = ttk.LabelFrame(
@@ -133,18 +194,37 @@ def create_options_panel(gui, parent):
     gui.options_notebook = ttk.Notebook(options_frame)
     gui.options_notebook.pack(fill=tk.BOTH, expand=True)
 
-    # Create tabs
-    _create_basic_options_tab(gui)
-    _create_ocr_options_tab(gui)
-    _create_advanced_options_tab(gui)
-    _create_accelerator_options_tab(gui)
-
-
-def _create_basic_options_tab(gui):
-    """Create the Basic Options tab (Internal helper)"""
-    tab = ttk.Frame(gui.options_notebook, padding="10")
-    gui.options_notebook.add(tab, text="Basic")
-
+    # Create tabs. Only the Basic tab is populated up front; the others are
+    # filled in the first time they are selected, which keeps the number of
+    # widgets created at startup down.
+    pending_tabs = {}
+    for text, builder in (
+        ("Basic", _create_basic_options_tab),
+        ("OCR", _create_ocr_options_tab),
+        ("Advanced", _create_advanced_options_tab),
+        ("Accelerator", _create_accelerator_options_tab),
+    ):
+        tab = ttk.Frame(gui.options_notebook, padding="10")
+        gui.options_notebook.add(tab, text=text)
+        pending_tabs[str(tab)] = (tab, builder)
+
+    def build_selected_tab(_event=None):
+        entry = pending_tabs.pop(gui.options_notebook.select(), None)
+        if entry:
+            tab, builder = entry
+            builder(gui, tab)
+        if not pending_tabs and binding is not None:
+            # Every tab is built; stop handling tab changes.
+            gui.options_notebook.unbind('<<NotebookTabChanged>>', binding)
+
+    binding = None
+    build_selected_tab()
+    binding = gui.options_notebook.bind(
+        '<<NotebookTabChanged>>', build_selected_tab)
+
+
+def _create_basic_options_tab(gui, tab):
+    """Populate the Basic Options tab (Internal helper)"""
     # Pipeline Type
     pipeline_frame = ttk.Frame(tab)
     pipeline_frame.pack(fill=tk.X, pady=5)
@@ -153,7 +233,7 @@ def _create_basic_options_tab(gui):
     pipeline_combo = ttk.Combobox(
         pipeline_frame,
         textvariable=gui.pipeline_type,
-        values=["Standard", "VLM", "ASR"],
+        values=config.PIPELINE_TYPES,
         state="readonly",
         width=15
     )
@@ -172,7 +252,7 @@ def _create_basic_options_tab(gui):
     vlm_combo = ttk.Combobox(
         gui.vlm_frame,
         textvariable=gui.vlm_model,
-        values=["granite_docling", "smolvlm"],
+        values=config.VLM_MODELS,
         state="readonly",
         width=15
     )
@@ -192,7 +272,7 @@ def _create_basic_options_tab(gui):
     format_combo = ttk.Combobox(
         format_frame,
         textvariable=gui.output_format,
-        values=["Markdown", "HTML", "JSON", "DocTags", "Text"],
+        values=config.OUTPUT_FORMATS,
         state="readonly",
         width=15
     )
@@ -212,7 +292,7 @@ def _create_basic_options_tab(gui):
 
     # Feature Checkboxes - 2 columns
     ttk.Label(tab, text="Processing Features:",
-              font=('', 9, 'bold')).pack(anchor=tk.W)
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     features_frame = ttk.Frame(tab)
     features_frame.pack(fill=tk.X, pady=5)
@@ -267,7 +347,7 @@ def _create_basic_options_tab(gui):
         right_col,
         text="Downloads a large model (~2-5 GB, free) on first use.\n"
              "Not needed for text or tables.",
-        foreground="#b45309", font=('', 8), justify=tk.LEFT)
+        style='Warning.TLabel', justify=tk.LEFT)
     pic_desc_note.pack(anchor=tk.W, padx=(20, 0))
 
     export_pic_check = ttk.Checkbutton(right_col, text="Export Pictures",
@@ -276,11 +356,8 @@ def _create_basic_options_tab(gui):
     create_tooltip(export_pic_check, "Save extracted images as separate files")
 
 
-def _create_ocr_options_tab(gui):
-    """Create the OCR Options tab (Internal helper)"""
-    tab = ttk.Frame(gui.options_notebook, padding="10")
-    gui.options_notebook.add(tab, text="OCR")
-
+def _create_ocr_options_tab(gui, tab):
+    """Populate the OCR Options tab (Internal helper)"""
     # OCR Engine
     engine_frame = ttk.Frame(tab)
     engine_frame.pack(fill=tk.X, pady=5)
@@ -313,7 +390,7 @@ def _create_ocr_options_tab(gui):
     lang_combo = ttk.Combobox(
         lang_frame,
         textvariable=gui.ocr_language,
-        values=[code for code, name in config.OCR_LANGUAGES],
+        values=config.OCR_LANGUAGE_CODES,
         state="readonly",
         width=15
     )
@@ -323,14 +400,14 @@ def _create_ocr_options_tab(gui):
 
     # Language hint
     ttk.Label(lang_frame, text="(English, German, Chinese, etc.)",
-              foreground="gray").pack(side=tk.LEFT, padx=(10, 0))
+              style='Muted.TLabel').pack(side=tk.LEFT, padx=(10, 0))
 
     # Separator
     ttk.Separator(tab, orient='horizontal').pack(fill=tk.X, pady=10)
 
     # OCR Options
-    ttk.Label(tab, text="OCR Options:", font=(
-        '', 9, 'bold')).pack(anchor=tk.W)
+    ttk.Label(tab, text="OCR Options:",
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     ttk.Checkbutton(tab, text="Force Full Page OCR (slower but more thorough)",
                     variable=gui.force_full_page_ocr).pack(anchor=tk.W, pady=5)
@@ -349,10 +426,10 @@ def _create_ocr_options_tab(gui):
         length=150
     )
     gui.conf_scale.pack(side=tk.LEFT, padx=(10, 5))
-    gui.conf_label = ttk.Label(conf_frame, text="0.5")
+    gui.conf_label = ttk.Label(
+        conf_frame, text=f"{gui.ocr_confidence.get():.2f}")
     gui.conf_label.pack(side=tk.LEFT)
-    gui.conf_scale.configure(
-        command=lambda v: gui.conf_label.config(text=f"{float(v):.2f}"))
+    gui.ocr_confidence.trace_add('write', gui.on_conf_scale)
     create_tooltip(
         gui.conf_scale,
         "Minimum confidence for recognised text.\n"
@@ -360,27 +437,22 @@ def _create_ocr_options_tab(gui):
     )
 
     # Note about OCR
-    note_frame = ttk.Frame(tab)
-    note_frame.pack(fill=tk.X, pady=(20, 0))
     ttk.Label(
-        note_frame,
+        tab,
         text="Note: RapidOCR is built-in. EasyOCR requires separate installation.\n"
              "Confidence Threshold applies to EasyOCR only.",
-        foreground="gray", font=('', 8), justify=tk.LEFT
-    ).pack(anchor=tk.W)
+        style='Hint.TLabel', justify=tk.LEFT
+    ).pack(anchor=tk.W, pady=(20, 0))
 
     # Set the initial enabled/disabled state of the confidence slider.
     gui.on_ocr_engine_change()
 
 
-def _create_advanced_options_tab(gui):
-    """Create the Advanced Options tab (Internal helper)"""
-    tab = ttk.Frame(gui.options_notebook, padding="10")
-    gui.options_notebook.add(tab, text="Advanced")
-
+def _create_advanced_options_tab(gui, tab):
+    """Populate the Advanced Options tab (Internal helper)"""
     # Table Options
-    ttk.Label(tab, text="Table Options:", font=(
-        '', 9, 'bold')).pack(anchor=tk.W)
+    ttk.Label(tab, text="Table Options:",
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     table_frame = ttk.Frame(tab)
     table_frame.pack(fill=tk.X, pady=5)
@@ -389,7 +461,7 @@ def _create_advanced_options_tab(gui):
     table_combo = ttk.Combobox(
         table_frame,
         textvariable=gui.table_mode,
-        values=["Fast", "Accurate"],
+        values=config.TABLE_MODES,
         state="readonly",
         width=12
     )
@@ -403,7 +475,7 @@ def _create_advanced_options_tab(gui):
 
     # Limits
     ttk.Label(tab, text="Processing Limits:",
-              font=('', 9, 'bold')).pack(anchor=tk.W)
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     limits_frame = ttk.Frame(tab)
     limits_frame.pack(fill=tk.X, pady=5)
@@ -418,7 +490,7 @@ def _create_advanced_options_tab(gui):
         width=8
     ).pack(side=tk.LEFT, padx=(5, 15))
     ttk.Label(limits_frame, text="(0 = unlimited)",
-              foreground="gray").pack(side=tk.LEFT)
+              style='Muted.TLabel').pack(side=tk.LEFT)
 
     limits_frame2 = ttk.Frame(tab)
     limits_frame2.pack(fill=tk.X, pady=5)
@@ -433,7 +505,7 @@ def _create_advanced_options_tab(gui):
         width=8
     ).pack(side=tk.LEFT, padx=(5, 15))
     ttk.Label(limits_frame2, text="(0 = unlimited)",
-              foreground="gray").pack(side=tk.LEFT)
+              style='Muted.TLabel').pack(side=tk.LEFT)
 
     limits_frame3 = ttk.Frame(tab)
     limits_frame3.pack(fill=tk.X, pady=5)
@@ -448,14 +520,14 @@ def _create_advanced_options_tab(gui):
         width=8
     ).pack(side=tk.LEFT, padx=(5, 15))
     ttk.Label(limits_frame3, text="(0 = no limit)",
-              foreground="gray").pack(side=tk.LEFT)
+              style='Muted.TLabel').pack(side=tk.LEFT)
 
     # Separator
     ttk.Separator(tab, orient='horizontal').pack(fill=tk.X, pady=10)
 
     # Image Generation
     ttk.Label(tab, text="Image Generation:",
-              font=('', 9, 'bold')).pack(anchor=tk.W)
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     img_frame = ttk.Frame(tab)
     img_frame.pack(fill=tk.X, pady=5)
@@ -479,17 +551,14 @@ def _create_advanced_options_tab(gui):
         width=8
     ).pack(side=tk.LEFT, padx=(5, 10))
     ttk.Label(scale_frame, text="(0.5 - 3.0)",
-              foreground="gray").pack(side=tk.LEFT)
-
+              style='Muted.TLabel').pack(side=tk.LEFT)
 
-def _create_accelerator_options_tab(gui):
-    """Create the Accelerator Options tab (Internal helper)"""
-    tab = ttk.Frame(gui.options_notebook, padding="10")
-    gui.options_notebook.add(tab, text="Accelerator")
 
+def _create_accelerator_options_tab(gui, tab):
+    """Populate the Accelerator Options tab (Internal helper)"""
     # Device Selection
     ttk.Label(tab, text="Hardware Acceleration:",
-              font=('', 9, 'bold')).pack(anchor=tk.W)
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     device_frame = ttk.Frame(tab)
     device_frame.pack(fill=tk.X, pady=5)
@@ -498,27 +567,25 @@ def _create_accelerator_options_tab(gui):
     device_combo = ttk.Combobox(
         device_frame,
         textvariable=gui.device,
-        values=["auto", "cpu", "cuda", "mps"],
+        values=config.DEVICES,
         state="readonly",
         width=12
     )
     device_combo.pack(side=tk.LEFT, padx=(10, 0))
 
     # Device descriptions
-    desc_frame = ttk.Frame(tab)
-    desc_frame.pack(fill=tk.X, pady=5)
     ttk.Label(
-        desc_frame,
+        tab,
         text="auto: Auto-detect | cuda: GPU | mps: Apple Silicon | cpu: CPU only",
-        foreground="gray", font=('', 8)
-    ).pack(anchor=tk.W)
+        style='Hint.TLabel'
+    ).pack(anchor=tk.W, pady=5)
 
     # Separator
     ttk.Separator(tab, orient='horizontal').pack(fill=tk.X, pady=10)
 
     # Threading
-    ttk.Label(tab, text="CPU Threading:", font=(
-        '', 9, 'bold')).pack(anchor=tk.W)
+    ttk.Label(tab, text="CPU Threading:",
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     thread_frame = ttk.Frame(tab)
     thread_frame.pack(fill=tk.X, pady=5)
@@ -532,14 +599,49 @@ def _create_accelerator_options_tab(gui):
         width=8
     ).pack(side=tk.LEFT, padx=(10, 10))
     ttk.Label(thread_frame, text="(1-32, default: 4)",
-              foreground="gray").pack(side=tk.LEFT)
+              style='Muted.TLabel').pack(side=tk.LEFT)
+
+    parallel_frame = ttk.Frame(tab)
+    parallel_frame.pack(fill=tk.X, pady=5)
+
+    ttk.Label(parallel_frame, text="Parallel Files:").pack(side=tk.LEFT)
+    parallel_spin = ttk.Spinbox(
+        parallel_frame,
+        from_=1,
+        to=16,
+        textvariable=gui.parallel_files,
+        width=8
+    )
+    parallel_spin.pack(side=tk.LEFT, padx=(10, 10))
+    ttk.Label(parallel_frame, text="(1 = one at a time)",
+              style='Muted.TLabel').pack(side=tk.LEFT)
+    create_tooltip(
+        parallel_spin,
+        "Convert several files at once in separate processes.\n"
+        "Each process loads its own copy of the models and the threads\n"
+        "above are shared between them. On a GPU (cuda/mps, or auto on a\n"
+        "machine with one), files are instead converted on threads sharing\n"
+        "one copy of the models."
+    )
+
+    split_check = ttk.Checkbutton(
+        tab, text="Split long PDFs across processes",
+        variable=gui.split_long_pdfs)
+    split_check.pack(anchor=tk.W, pady=5)
+    create_tooltip(
+        split_check,
+        "With Parallel Files above 1, convert each long PDF as page ranges\n"
+        "in separate processes and join the results, so a single large\n"
+        "document uses every process. Markdown and Text output only;\n"
+        "not used on a GPU."
+    )
 
     # Separator
     ttk.Separator(tab, orient='horizontal').pack(fill=tk.X, pady=10)
 
     # CUDA Options
-    ttk.Label(tab, text="CUDA Options:", font=(
-        '', 9, 'bold')).pack(anchor=tk.W)
+    ttk.Label(tab, text="CUDA Options:",
+              style='Heading.TLabel').pack(anchor=tk.W)
 
     ttk.Checkbutton(tab, text="Use Flash Attention 2 (requires compatible GPU)",
                     variable=gui.use_flash_attention).pack(anchor=tk.W, pady=5)
@@ -569,7 +671,17 @@ def create_output_panel(gui, parent):
     ttk.Checkbutton(options_frame, text="Create subfolder per file",
                     variable=gui.create_subfolder).pack(side=tk.LEFT, padx=(0, 15))
     ttk.Checkbutton(options_frame, text="Overwrite existing",
-                    variable=gui.overwrite_files).pack(side=tk.LEFT)
+                    variable=gui.overwrite_files).pack(side=tk.LEFT, padx=(0, 15))
+    skip_check = ttk.Checkbutton(options_frame, text="Skip already converted",
+                                 variable=gui.skip_converted)
+    skip_check.pack(side=tk.LEFT)
+    create_tooltip(
+        skip_check,
+        "Skip files that were converted before with the same options and\n"
+        "are unchanged since, as long as their output still exists.\n"
+        "Has no effect while \"Overwrite existing\" is ticked.\n"
+        "Settings > Forget Converted Files clears this memory."
+    )
 
 
 def create_preview_panel(gui, parent):
@@ -593,7 +705,7 @@ def create_preview_panel(gui, parent):
         preview_tab,
         wrap=tk.WORD,
         yscrollcommand=preview_scroll.set,
-        font=('Consolas', 10),
+        font=MONO_FONT,
         state=tk.DISABLED
     )
     gui.preview_text.pack(fill=tk.BOTH, expand=True)
@@ -610,7 +722,7 @@ def create_preview_panel(gui, parent):
         log_tab,
         wrap=tk.WORD,
         yscrollcommand=log_scroll.set,
-        font=('Consolas', 9),
+        font=MONO_FONT_SMALL,
         state=tk.DISABLED
     )
     gui.log_text.pack(fill=tk.BOTH, expand=True)
@@ -626,10 +738,9 @@ def create_controls_panel(gui, parent):
     progress_frame = ttk.Frame(controls_frame)
     progress_frame.pack(fill=tk.X, pady=(0, 10))
 
-    gui.progress_var = tk.DoubleVar(value=0)
     gui.progress_bar = ttk.Progressbar(
         progress_frame,
-        variable=gui.progress_var,
+        value=0,
         maximum=100
     )
     gui.progress_bar.pack(fill=tk.X, side=tk.LEFT,
@@ -640,7 +751,7 @@ def create_controls_panel(gui, parent):
 
     # Status label
     gui.status_label = ttk.Label(
-        controls_frame, text="Ready", foreground="gray")
+        controls_frame, text="Ready", style='Muted.TLabel')
     gui.status_label.pack(fill=tk.X, pady=(0, 10))
 
     # Buttons
@@ -30,6 +30,8 @@ import logging
 import logging.handlers
 import platform
 import sys
+import threading
+import time
 import tkinter as tk
 from datetime import datetime
 
@@ -48,6 +50,10 @@ _FILE_DATEFMT = "%Y-%m-%d %H:%M:%S"
 _NOISY_LOGGERS = ("urllib3", "PIL", "matplotlib", "filelock", "fsspec",
                   "huggingface_hub", "datasets", "torch", "transformers")
 
+# Records reaching the Log tab are batched and written at most this often, so a
+# busy worker thread queues one Tk event per interval instead of one per line.
+_GUI_FLUSH_MS = 100
+
 
 class _GuiFilter(logging.Filter):
     """Keep the on-screen Log tab readable: show the app's own messages, plus
@@ -64,11 +70,18 @@ class _GuiFormatter(logging.Formatter):
 
     Errors/warnings get their level prefixed so they stand out. The full
     traceback is deliberately *not* included here (it goes to the file) to keep
-    the on-screen log readable.
+    the on-screen log readable. The timestamp string is reused for records
+    logged within the same second, which is most of them in a busy batch.
     """
 
+    _stamp = (None, "")  # (whole second, its formatted HH:MM:SS)
+
     def format(self, record):
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        second = int(record.created)
+        cached_second, timestamp = self._stamp
+        if second != cached_second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            self._stamp = (second, timestamp)
         message = record.getMessage()
         if record.levelno >= logging.WARNING:
             return f"[{timestamp}] {record.levelname}: {message}"
@@ -79,14 +92,25 @@ class TkTextHandler(logging.Handler):
     """Logging handler that appends records to a Tk ``Text`` widget.
 
     ``emit`` can be called from any thread (the conversion runs on a worker
-    thread), so the actual widget update is marshalled onto the Tk main loop
-    via ``root.after``.
+    thread). Records are collected in a pending list, and the first record of
+    a batch schedules one ``root.after`` flush on the Tk main loop that writes
+    the whole batch with a single insert. Old lines are trimmed back to the
+    newest ``max_lines`` once 10% more have built up, so a full log is cut in
+    chunks rather than on every flush. The view follows new lines only while
+    it is scrolled to the bottom, so reading back through the log during a
+    batch isn't interrupted (and the widget isn't re-scrolled per flush).
     """
 
-    def __init__(self, text_widget, root):
+    def __init__(self, text_widget, root, max_lines=config.LOG_TAB_MAX_LINES,
+                 flush_ms=_GUI_FLUSH_MS):
         super().__init__()
         self.text_widget = text_widget
         self.root = root
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
 
     def emit(self, record):
         try:
@@ -94,16 +118,36 @@ class TkTextHandler(logging.Handler):
         except Exception:  # pylint: disable=broad-except
             self.handleError(record)
             return
+        with self._pending_lock:
+            self._pending.append(message)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
         # Schedule the widget write on the main thread; safe from any thread.
         # RuntimeError means the interpreter/main loop is shutting down.
         with contextlib.suppress(RuntimeError):
-            self.root.after(0, self._append, message)
+            self.root.after(self.flush_ms, self._flush)
+
+    def _flush(self):
+        with self._pending_lock:
+            messages = self._pending
+            self._pending = []
+            self._flush_scheduled = False
+        # Lines beyond max_lines would be trimmed straight away; skip them.
+        self._append("\n".join(messages[-self.max_lines:]))
 
     def _append(self, message):
         try:
+            follow = self.text_widget.yview()[1] >= 1.0
             self.text_widget.config(state=tk.NORMAL)
             self.text_widget.insert(tk.END, message + "\n")
-            self.text_widget.see(tk.END)
+            # "end-1c" sits on the empty line after the last newline.
+            lines = int(self.text_widget.index("end-1c").split(".")[0]) - 1
+            if lines > self.max_lines + self.max_lines // 10:
+                self.text_widget.delete(
+                    "1.0", f"{lines - self.max_lines + 1}.0")
+            if follow:
+                self.text_widget.see(tk.END)
             self.text_widget.config(state=tk.DISABLED)
         except tk.TclError:
             pass  # widget was destroyed during shutdown
@@ -170,7 +214,11 @@ def _docling_version(docling_available):
 
 def log_session_header(dnd_available):
     """Log an environment banner. Call after setup_file_logging but before the
-    GUI handler is attached, so it lands in the file only."""
+    GUI handler is attached, so it lands in the file only.
+
+    Pipeline availability (VLM/ASR/OCR) is logged later, when docling is
+    first imported, so the banner doesn't force that slow import at startup.
+    """
     # Imported lazily so this logging module stays cheap to import on its own.
     import conversion_utils
 
@@ -180,10 +228,6 @@ def log_session_header(dnd_available):
     logger.info("Platform : %s", platform.platform())
     logger.info("Python   : %s", sys.version.replace("\n", " "))
     logger.info("Docling  : %s", _docling_version(conversion_utils.DOCLING_AVAILABLE))
-    logger.info("Pipelines: VLM=%s  ASR=%s  OCR-options=%s",
-                conversion_utils.VLM_AVAILABLE,
-                conversion_utils.ASR_AVAILABLE,
-                conversion_utils.OCR_OPTIONS_AVAILABLE)
     logger.info("Drag&drop: %s", dnd_available)
     logger.info("Settings : %s", config.SETTINGS_FILE)
     logger.info("Log file : %s", config.LOG_FILE)
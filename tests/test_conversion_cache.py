@@ -0,0 +1,89 @@
+"""
+Unit tests for conversion_cache.
+
+Uses the stdlib unittest framework so it can be run with no extra
+dependencies:  python -m unittest discover -s tests
+"""
+import os
+import tempfile
+import unittest
+
+import conversion_cache as cc
+
+
+class ConversionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        self.source = os.path.join(self.dir, "report.pdf")
+        with open(self.source, "wb") as f:
+            f.write(b"%PDF")
+        self.output = os.path.join(self.dir, "report.md")
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write("# out")
+        self.digest = cc.settings_digest({"output_format": "Markdown"})
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_marked_input_is_found_while_output_exists(self):
+        index = {}
+        key = cc.key_for(self.source, self.digest)
+        cc.mark_done(index, key, self.output)
+        self.assertEqual(cc.cached_output(index, key), self.output)
+
+        os.remove(self.output)
+        self.assertIsNone(cc.cached_output(index, key))
+
+    def test_forgotten_output_is_not_found(self):
+        index = {}
+        key = cc.key_for(self.source, self.digest)
+        cc.mark_done(index, key, self.output)
+        cc.mark_done(index, "other", os.path.join(self.dir, "other.md"))
+        cc.forget_outputs(index, [self.output])
+        self.assertIsNone(cc.cached_output(index, key))
+        self.assertEqual(list(index), ["other"])
+
+    def test_key_changes_with_content_and_settings(self):
+        key = cc.key_for(self.source, self.digest)
+        other = cc.settings_digest({"output_format": "HTML"})
+        self.assertNotEqual(key, cc.key_for(self.source, other))
+
+        with open(self.source, "ab") as f:
+            f.write(b" more")
+        self.assertNotEqual(key, cc.key_for(self.source, self.digest))
+
+    def test_output_location_changes_digest(self):
+        base = {"output_format": "Markdown", "output_directory": self.dir,
+                "create_subfolder": False}
+        key = cc.key_for(self.source, cc.settings_digest(base))
+        index = {}
+        cc.mark_done(index, key, self.output)
+        for changed in ({"output_directory": os.path.join(self.dir, "new")},
+                        {"create_subfolder": True}):
+            other = cc.key_for(self.source, cc.settings_digest({**base, **changed}))
+            self.assertIsNone(cc.cached_output(index, other))
+
+    def test_speed_settings_do_not_change_digest(self):
+        base = {"output_format": "Markdown", "device": "cpu", "num_threads": 4}
+        self.assertEqual(cc.settings_digest(base),
+                         cc.settings_digest({**base, "device": "cuda", "num_threads": 8}))
+
+    def test_missing_input_has_no_key(self):
+        self.assertIsNone(cc.key_for(os.path.join(self.dir, "gone.pdf"), self.digest))
+
+    def test_save_and_load_round_trip(self):
+        path = os.path.join(self.dir, "index.json")
+        self.assertEqual(cc.load_index(path), {})
+        cc.save_index({"k": self.output}, path)
+        self.assertEqual(cc.load_index(path), {"k": self.output})
+
+    def test_corrupt_index_loads_empty(self):
+        path = os.path.join(self.dir, "index.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertEqual(cc.load_index(path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,10 @@ Unit tests for conversion_utils.
 Uses the stdlib unittest framework so it can be run with no extra
 dependencies:  python -m unittest discover -s tests
 """
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import conversion_utils as cu
 
@@ -58,6 +61,17 @@ class ExportContentTests(unittest.TestCase):
         out = cu.export_content(result, "JSON")
         self.assertEqual(json.loads(out), {"text": "hello"})
 
+    def test_json_keeps_non_ascii_unescaped(self):
+        out = cu.export_content(FakeResult("na\u00efve"), "JSON")
+        self.assertIn("na\u00efve", out)
+        self.assertIn('\n  "text"', out)
+
+    def test_json_without_orjson_matches(self):
+        import json
+        with mock.patch.object(cu, "orjson", None):
+            out = cu.export_content(FakeResult("na\u00efve"), "JSON")
+        self.assertEqual(out, json.dumps({"text": "na\u00efve"}, indent=2, ensure_ascii=False))
+
     def test_text_strips_markdown_formatting(self):
         md = "# Heading\n\n**bold** and *italic* with [link](http://x) and ![img](y.png)"
         out = cu.export_content(FakeResult(md), "Text")
@@ -69,11 +83,335 @@ class ExportContentTests(unittest.TestCase):
         self.assertIn("link", out)
         self.assertNotIn("http://x", out)
 
+    def test_text_strips_nested_formatting(self):
+        md = "[**bold link**](http://x) and ***both***"
+        self.assertEqual(cu.export_content(FakeResult(md), "Text"), "bold link and both")
+
     def test_unknown_format_falls_back_to_markdown(self):
         result = FakeResult("# Title")
         self.assertEqual(cu.export_content(result, "Nonsense"), "# Title")
 
 
+class BuildConvertKwargsTests(unittest.TestCase):
+    def test_zero_limits_add_nothing(self):
+        self.assertEqual(
+            cu.build_convert_kwargs({"max_pages": 0, "max_file_size_mb": 0}), {})
+
+    def test_limits_are_applied(self):
+        kwargs = cu.build_convert_kwargs({"max_pages": 3, "max_file_size_mb": 2})
+        self.assertEqual(kwargs["page_range"], (1, 3))
+        self.assertEqual(kwargs["max_file_size"], 2 * 1024 * 1024)
+
+
+class SaveOutputTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.out_dir = self._tmp.name
+        self.settings = {
+            "output_format": "Markdown",
+            "output_directory": self.out_dir,
+            "create_subfolder": False,
+            "overwrite_files": False,
+        }
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_writes_content_next_to_base_name(self):
+        path, content = cu.save_output(
+            FakeResult("# Hi"), "/in/report.pdf", self.settings)
+        self.assertEqual(path, os.path.join(self.out_dir, "report.md"))
+        self.assertEqual(content, "# Hi")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# Hi")
+
+    def test_writes_utf8_with_unchanged_line_endings(self):
+        path, _ = cu.save_output(
+            FakeResult("caf\u00e9\nna\u00efve"), "/in/report.pdf", self.settings)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), "caf\u00e9\nna\u00efve".encode("utf-8"))
+
+    def test_write_leaves_no_temp_file(self):
+        path, _ = cu.save_output(FakeResult("# Hi"), "/in/report.pdf", self.settings)
+        self.assertEqual(os.listdir(self.out_dir), [os.path.basename(path)])
+
+    def test_failed_write_leaves_nothing_behind(self):
+        path = os.path.join(self.out_dir, "x.md")
+        with (
+            mock.patch.object(cu.os, "replace", side_effect=OSError("disk full")),
+            self.assertRaises(OSError),
+        ):
+            cu._write_output(path, b"x")
+        self.assertEqual(os.listdir(self.out_dir), [])
+
+    def test_returns_only_preview_but_writes_everything(self):
+        body = "x" * (cu.PREVIEW_CHARS + 10)
+        path, preview = cu.save_output(FakeResult(body), "/in/big.pdf", self.settings)
+        self.assertEqual(preview, body[:cu.PREVIEW_CHARS] + cu.PREVIEW_TRUNCATED)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), body)
+
+    def test_short_preview_is_not_marked(self):
+        _, preview = cu.save_output(FakeResult("short"), "/in/small.pdf", self.settings)
+        self.assertEqual(preview, "short")
+
+    def test_existing_output_is_not_overwritten(self):
+        first, _ = cu.save_output(FakeResult("a"), "/in/report.pdf", self.settings)
+        second, _ = cu.save_output(FakeResult("b"), "/in/report.pdf", self.settings)
+        self.assertNotEqual(first, second)
+
+    def test_queued_output_counts_as_existing(self):
+        with cu.OutputWriter() as writer:
+            first, _ = cu.save_output(
+                FakeResult("a"), "/in/report.pdf", self.settings, writer)
+            second, _ = cu.save_output(
+                FakeResult("b"), "/in/report.docx", self.settings, writer)
+        self.assertNotEqual(first, second)
+        self.assertEqual(writer.failed, [])
+        with open(first, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a")
+        with open(second, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "b")
+
+    def test_writer_collects_failed_writes(self):
+        missing = os.path.join(self.out_dir, "gone", "x.md")
+        with cu.OutputWriter() as writer:
+            writer.submit(missing, b"x")
+        self.assertEqual([path for path, _ in writer.failed], [missing])
+
+    def test_writer_survives_unexpected_errors(self):
+        path = os.path.join(self.out_dir, "x.md")
+        real_write = cu._write_output
+
+        def write(target, data):
+            if target == "bad":
+                raise ValueError("bad path")
+            real_write(target, data)
+
+        # With one queue slot, a dead writer thread would block submit.
+        with (
+            mock.patch.object(cu, "_write_output", write),
+            cu.OutputWriter(max_pending=1) as writer,
+        ):
+            writer.submit("bad", b"x")
+            writer.submit(path, b"x")
+            writer.submit(path, b"y")
+        self.assertEqual([p for p, _ in writer.failed], ["bad"])
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "y")
+
+    def test_batch_paths_are_unique_for_same_named_inputs(self):
+        files = ["/in/report.pdf", "/in/report.docx", "/other/report.html"]
+        for overwrite in (False, True):
+            settings = {**self.settings, "overwrite_files": overwrite}
+            paths = cu.resolve_output_paths(files, settings)
+            self.assertEqual(list(paths), files)
+            self.assertEqual(len(set(paths.values())), len(files))
+        self.assertEqual(paths["/in/report.pdf"],
+                         os.path.join(self.out_dir, "report.md"))
+
+    def test_given_output_path_is_used(self):
+        path = os.path.join(self.out_dir, "chosen.md")
+        written, _ = cu.save_output(
+            FakeResult("a"), "/in/report.pdf", self.settings, output_path=path)
+        self.assertEqual(written, path)
+        written, _ = cu.save_joined_output(
+            ["a", "b"], "/in/report.pdf", self.settings, path)
+        self.assertEqual(written, path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a" + cu.SPLIT_JOINER + "b")
+
+    def test_subfolder_per_file(self):
+        path = cu.resolve_output_path(
+            "/in/report.pdf", {**self.settings, "create_subfolder": True})
+        self.assertEqual(
+            path, os.path.join(self.out_dir, "report", "report.md"))
+
+
+class ConverterCacheKeyTests(unittest.TestCase):
+    base = {"pipeline_type": "Standard", "device": "cpu", "enable_ocr": True}
+
+    def test_output_only_settings_share_a_key(self):
+        a = cu.converter_cache_key({**self.base, "output_format": "Markdown"})
+        b = cu.converter_cache_key({**self.base, "output_format": "JSON",
+                                    "max_pages": 5})
+        self.assertEqual(a, b)
+
+    def test_pipeline_settings_change_the_key(self):
+        a = cu.converter_cache_key(self.base)
+        b = cu.converter_cache_key({**self.base, "enable_ocr": False})
+        self.assertNotEqual(a, b)
+
+    def test_clear_drops_cached_converters(self):
+        cu._converter_cache["key"] = (object(), "Standard")
+        self.assertTrue(cu.clear_converter_cache())
+        self.assertEqual(len(cu._converter_cache), 0)
+
+    def test_clear_does_not_wait_for_a_build(self):
+        cu._converter_cache["key"] = (object(), "Standard")
+        with cu._converter_cache_lock:  # as while get_converter builds
+            self.assertFalse(cu.clear_converter_cache())
+        self.assertEqual(len(cu._converter_cache), 1)
+        cu.clear_converter_cache()
+
+
+class ParallelWorkerCountTests(unittest.TestCase):
+    def test_capped_by_file_count(self):
+        self.assertEqual(
+            cu.parallel_worker_count({"parallel_files": 8, "device": "cpu"}, 3), 3)
+
+    def test_gpu_devices_use_one_worker(self):
+        for device in ("cuda", "mps"):
+            self.assertEqual(
+                cu.parallel_worker_count({"parallel_files": 4, "device": device}, 10), 1)
+
+    def test_defaults_to_sequential(self):
+        self.assertEqual(cu.parallel_worker_count({}, 10), 1)
+
+    def test_auto_device_follows_gpu_availability(self):
+        settings = {"parallel_files": 4, "device": "auto"}
+        with mock.patch.object(cu, "_gpu_present", True):
+            self.assertEqual(cu.parallel_worker_count(settings, 10), 1)
+            self.assertEqual(cu.thread_document_count(settings, 10), 4)
+        with mock.patch.object(cu, "_gpu_present", False):
+            self.assertEqual(cu.parallel_worker_count(settings, 10), 4)
+            self.assertEqual(cu.thread_document_count(settings, 10), 1)
+
+
+class PrefetchFilesTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for name in ("a.pdf", "b.pdf"):
+            path = os.path.join(self._tmp.name, name)
+            with open(path, "wb") as f:
+                f.write(b"%PDF")
+            self.files.append(path)
+        # A missing file and a directory, which cannot be opened for reading.
+        self.unreadable = [os.path.join(self._tmp.name, "missing.pdf"),
+                           self._tmp.name]
+        self.paths = [self.unreadable[0], self.files[0],
+                      self.unreadable[1], self.files[1]]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_advises_each_readable_file(self):
+        advised = []
+
+        def fadvise(fd, offset, length, advice):
+            advised.append((os.fstat(fd).st_ino, offset, length, advice))
+
+        with (
+            mock.patch.object(cu.os, "posix_fadvise", fadvise, create=True),
+            mock.patch.object(cu.os, "POSIX_FADV_WILLNEED", 3, create=True),
+        ):
+            cu.prefetch_files(self.paths)
+        self.assertEqual(
+            advised, [(os.stat(path).st_ino, 0, 0, 3) for path in self.files])
+
+    def test_reads_without_fadvise(self):
+        reads = []
+
+        def fake_open(path, mode):
+            if path in self.unreadable:
+                raise OSError(path)
+            handle = mock.mock_open(read_data=b"%PDF")()
+            handle.read.side_effect = lambda size: reads.append((path, size))
+            return handle
+
+        with (
+            mock.patch.object(cu.os, "posix_fadvise", None, create=True),
+            mock.patch("builtins.open", fake_open),
+        ):
+            cu.prefetch_files(self.paths, read_bytes=2)
+        self.assertEqual(reads, [(path, 2) for path in self.files])
+
+
+class PageSplitTests(unittest.TestCase):
+    settings = {"split_long_pdfs": True, "output_format": "Markdown",
+                "parallel_files": 4, "device": "cpu"}
+
+    def test_ranges_cover_every_page_in_order(self):
+        self.assertEqual(cu.page_ranges(45, 4),
+                         [(1, 12), (13, 23), (24, 34), (35, 45)])
+
+    def test_ranges_are_never_too_short(self):
+        self.assertEqual(cu.page_ranges(25, 8), [(1, 13), (14, 25)])
+        self.assertEqual(cu.page_ranges(cu.SPLIT_MIN_PAGES, 4),
+                         [(1, cu.SPLIT_MIN_PAGES)])
+
+    def test_no_splits_unless_enabled(self):
+        self.assertEqual(cu.plan_page_splits(
+            ["/in/a.pdf"], {**self.settings, "split_long_pdfs": False}), {})
+
+    def test_no_splits_for_formats_that_cannot_be_joined(self):
+        self.assertEqual(cu.plan_page_splits(
+            ["/in/a.pdf"], {**self.settings, "output_format": "JSON"}), {})
+
+    def test_no_splits_on_gpu(self):
+        self.assertEqual(cu.plan_page_splits(
+            ["/in/a.pdf"], {**self.settings, "device": "cuda"}), {})
+
+    def test_splits_long_pdfs_only(self):
+        counts = {"/in/long.pdf": 100, "/in/short.pdf": 12}
+        with mock.patch.object(cu, "pdf_page_count", counts.get):
+            splits = cu.plan_page_splits(
+                ["/in/long.pdf", "/in/short.pdf", "/in/b.docx"], self.settings)
+        self.assertEqual(list(splits), ["/in/long.pdf"])
+        self.assertEqual(len(splits["/in/long.pdf"]), 4)
+
+
+class IsTransientErrorTests(unittest.TestCase):
+    def test_transient_exceptions(self):
+        self.assertTrue(cu.is_transient_error(TimeoutError()))
+        self.assertTrue(cu.is_transient_error(ConnectionResetError()))
+
+    def test_transient_messages(self):
+        self.assertTrue(cu.is_transient_error("CUDA out of memory. Tried to allocate 2 GiB"))
+        self.assertTrue(cu.is_transient_error("Read timed out"))
+
+    def test_permanent_errors(self):
+        self.assertFalse(cu.is_transient_error(FileNotFoundError("missing.pdf")))
+        self.assertFalse(cu.is_transient_error("Input document is not valid"))
+
+
+class ThreadDocumentCountTests(unittest.TestCase):
+    def test_gpu_devices_use_threads(self):
+        for device in ("cuda", "mps"):
+            self.assertEqual(
+                cu.thread_document_count({"parallel_files": 4, "device": device}, 10), 4)
+
+    def test_cpu_leaves_parallelism_to_processes(self):
+        self.assertEqual(
+            cu.thread_document_count({"parallel_files": 4, "device": "cpu"}, 10), 1)
+
+    def test_capped_by_file_count(self):
+        self.assertEqual(
+            cu.thread_document_count({"parallel_files": 8, "device": "cuda"}, 2), 2)
+
+
+@unittest.skipUnless(cu.DOCLING_AVAILABLE, "docling not installed")
+class ResultErrorTests(unittest.TestCase):
+    def _result(self, status, messages=()):
+        from types import SimpleNamespace
+        errors = [SimpleNamespace(error_message=m) for m in messages]
+        return SimpleNamespace(status=status, errors=errors)
+
+    def test_success_and_partial_success_pass(self):
+        from docling.datamodel.base_models import ConversionStatus
+
+        for status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+            self.assertIsNone(cu.result_error(self._result(status)))
+
+    def test_failure_reports_errors(self):
+        from docling.datamodel.base_models import ConversionStatus
+
+        result = self._result(ConversionStatus.FAILURE, ["bad page", "no text"])
+        self.assertEqual(cu.result_error(result), "bad page; no text")
+        self.assertIn("failure", cu.result_error(self._result(ConversionStatus.FAILURE)))
+
+
 @unittest.skipUnless(cu.DOCLING_AVAILABLE, "docling not installed")
 class BuildConverterTests(unittest.TestCase):
     base = {"device": "cpu", "num_threads": 4}
@@ -135,6 +473,17 @@ class BuildPipelineOptionsTests(unittest.TestCase):
         self.assertEqual(fast.table_structure_options.mode, TableFormerMode.FAST)
         self.assertEqual(accurate.table_structure_options.mode, TableFormerMode.ACCURATE)
 
+    def test_optional_fields_propagate(self):
+        opts = cu.build_pipeline_options({
+            "device": "cpu",
+            "do_formula_enrichment": False,
+            "images_scale": 2.0,
+            "document_timeout": 30,
+        })
+        self.assertFalse(opts.do_formula_enrichment)
+        self.assertEqual(opts.images_scale, 2.0)
+        self.assertEqual(opts.document_timeout, 30.0)
+
     @unittest.skipUnless(cu.PICTURE_DESCRIPTION_AVAILABLE, "presets unavailable")
     def test_picture_description_follows_vlm_model(self):
         granite = cu.build_pipeline_options({
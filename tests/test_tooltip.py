@@ -0,0 +1,57 @@
+"""
+Unit tests for tooltip.
+
+Uses the stdlib unittest framework so it can be run with no extra
+dependencies:  python -m unittest discover -s tests
+Skipped when no display is available.
+"""
+import tkinter as tk
+import unittest
+
+from tooltip import ToolTip, create_tooltip
+
+
+def _make_root():
+    """A hidden Tk root, or None without a display."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+class ToolTipTests(unittest.TestCase):
+    def setUp(self):
+        self.root = _make_root()
+        if self.root is None:
+            self.skipTest("no display available")
+
+    def tearDown(self):
+        self.root.destroy()
+        # Forget the shared state tied to the destroyed interpreter.
+        ToolTip._by_widget.clear()
+        ToolTip._bound_tk = ToolTip._window = ToolTip._label = None
+        ToolTip._owner = ToolTip._scheduled = ToolTip._after_id = None
+        ToolTip._geometry = ToolTip._text = None
+
+    def _label(self):
+        label = tk.Label(self.root, text="x")
+        label.pack()
+        return label
+
+    def test_tooltips_survive_the_first_widget_being_destroyed(self):
+        first, second = self._label(), self._label()
+        create_tooltip(first, "first")
+        tooltip = create_tooltip(second, "second")
+        self.root.update_idletasks()
+
+        first.destroy()
+        second.event_generate('<Enter>')
+        self.assertIs(ToolTip._scheduled, tooltip)
+        second.event_generate('<Leave>')
+        self.assertIsNone(ToolTip._scheduled)
+
+
+if __name__ == "__main__":
+    unittest.main()
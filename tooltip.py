@@ -4,12 +4,38 @@ Provides a simple way to add hover tooltips to tkinter widgets
 """
 import tkinter as tk
 
+# Bind tag added to every widget with a tooltip; the events are bound once on
+# this tag instead of once per widget.
+_BINDTAG = "DoclingToolTip"
+
 
 class ToolTip:
     """
     Create a tooltip for a given widget with hover functionality.
+
+    Only one tooltip is visible at a time, so all tooltips share a single
+    window, built on the first hover and then only hidden, refilled and shown
+    again rather than created and destroyed on every hover. Likewise at most
+    one tooltip is waiting to appear, so they share one pending timer. The
+    hover events are bound once, on a bind tag every such widget carries.
     """
 
+    # ToolTip per widget path name, for the bind-tag event handlers.
+    _by_widget = {}
+    # Tcl interpreter the bind-tag handlers are registered in.
+    _bound_tk = None
+
+    # The shared window and its label, and the ToolTip currently showing it.
+    _window = None
+    _label = None
+    _owner = None
+    # Last geometry and text applied to the shared window.
+    _geometry = None
+    _text = None
+    # The shared show timer, and the ToolTip it will show.
+    _after_id = None
+    _scheduled = None
+
     def __init__(self, widget, text, delay=500):
         """
         Initialize the tooltip.
@@ -22,13 +48,39 @@ class ToolTip:
         self.widget = widget
         self.text = text
         self.delay = delay
-        self.tooltip_window = None
-        self.after_id = None
 
-        # Bind events
-        self.widget.bind('<Enter>', self.on_enter)
-        self.widget.bind('<Leave>', self.on_leave)
-        self.widget.bind('<Button>', self.on_leave)  # Hide on click
+        if ToolTip._bound_tk is not widget.tk:
+            ToolTip._bind_tag(widget)
+        ToolTip._by_widget[str(widget)] = self
+        # Appended last, so the widget's own bindings run first and are kept
+        widget.bindtags(widget.bindtags() + (_BINDTAG,))
+
+    @staticmethod
+    def _bind_tag(widget):
+        """Register the tooltip event handlers on the bind tag.
+
+        Each handler is a Tcl command passed only the widget path (%W), so
+        no Event object is built for every Enter, Leave or click. The
+        commands are registered on the root window: ones registered on a
+        widget are deleted with it, which would break every other tooltip.
+        """
+        root = widget.nametowidget('.')
+
+        def bind(sequence, method):
+            def handler(path):
+                tooltip = ToolTip._by_widget.get(path)
+                if tooltip is not None:
+                    method(tooltip)
+            command = root.register(handler)
+            root.bind_class(_BINDTAG, sequence, f'{command} %W')
+
+        bind('<Enter>', ToolTip.on_enter)
+        bind('<Leave>', ToolTip.on_leave)
+        # Hide on click
+        bind('<Button>', ToolTip.on_leave)
+        # The shared window outlives the widget, so hide it with the widget
+        bind('<Destroy>', ToolTip.on_destroy)
+        ToolTip._bound_tk = widget.tk
 
     def on_enter(self, _event=None):
         """Schedule tooltip to appear after delay"""
@@ -36,38 +88,71 @@ class ToolTip:
 
     def on_leave(self, _event=None):
         """Cancel scheduled tooltip and hide if visible"""
+        if ToolTip._scheduled is not self and ToolTip._owner is not self:
+            return  # nothing pending or shown for this widget: no Tcl calls
         self.cancel_tooltip()
         self.hide_tooltip()
 
+    def on_destroy(self, _event=None):
+        """Hide the tooltip and forget it when its widget is destroyed"""
+        self.on_leave()
+        ToolTip._by_widget.pop(str(self.widget), None)
+
     def schedule_tooltip(self):
-        """Schedule the tooltip to appear after the delay"""
-        self.cancel_tooltip()
-        self.after_id = self.widget.after(self.delay, self.show_tooltip)
+        """Schedule the tooltip to appear after the delay, replacing any
+        other tooltip's pending show"""
+        if ToolTip._scheduled is not None:
+            ToolTip._scheduled.cancel_tooltip()
+        ToolTip._after_id = self.widget.after(self.delay, self.show_tooltip)
+        ToolTip._scheduled = self
 
     def cancel_tooltip(self):
         """Cancel the scheduled tooltip"""
-        if self.after_id:
-            self.widget.after_cancel(self.after_id)
-            self.after_id = None
+        if ToolTip._scheduled is self:
+            self.widget.after_cancel(ToolTip._after_id)
+            ToolTip._after_id = None
+            ToolTip._scheduled = None
 
     def show_tooltip(self):
         """Display the tooltip"""
-        if self.tooltip_window:
+        if ToolTip._scheduled is self:
+            ToolTip._after_id = None
+            ToolTip._scheduled = None
+        if ToolTip._owner is self:
             return
 
         # Get widget position
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-        # Create tooltip window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        window = ToolTip._window
+        if window is None or not window.winfo_exists():
+            window = self._build_window()
+        # Re-hovering the same widget needs neither call.
+        if self.text != ToolTip._text:
+            ToolTip._label.configure(text=self.text)
+            ToolTip._text = self.text
+        geometry = f"+{x}+{y}"
+        if geometry != ToolTip._geometry:
+            window.wm_geometry(geometry)
+            ToolTip._geometry = geometry
+        window.deiconify()
+        window.lift()
+        ToolTip._owner = self
+
+    def _build_window(self):
+        """Create the shared (initially hidden) tooltip window and its label.
+
+        It belongs to the root window, so it outlives any dialog whose
+        widgets have tooltips.
+        """
+        window = tk.Toplevel(self.widget.nametowidget('.'))
+        window.withdraw()
+        window.wm_overrideredirect(True)
 
         # Create tooltip label with styling
         label = tk.Label(
-            self.tooltip_window,
-            text=self.text,
+            window,
             background="#ffffd0",
             foreground="#000000",
             relief=tk.SOLID,
@@ -78,12 +163,17 @@ class ToolTip:
             justify=tk.LEFT
         )
         label.pack()
+        ToolTip._window = window
+        ToolTip._label = label
+        ToolTip._geometry = None
+        ToolTip._text = None
+        return window
 
     def hide_tooltip(self):
         """Hide the tooltip"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if ToolTip._owner is self:
+            ToolTip._window.withdraw()
+            ToolTip._owner = None
 
 
 def create_tooltip(widget, text, delay=500):